@@ -2,135 +2,208 @@
 Environment Configuration Management
 Handles all environment variables and configuration for secretGPT
 """
+import logging
 import os
-from typing import Optional
-from pydantic_settings import BaseSettings
-from pydantic import Field
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Callable, Dict, Optional, Tuple
 
+logger = logging.getLogger(__name__)
 
-class Settings(BaseSettings):
+
+ENV_FILE = ".env"
+
+# Set once a .env file has been exported into os.environ
+_env_file_loaded = False
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
     """
     Application settings loaded from environment variables
     Following the documentation requirements for configuration
     """
-    
+
     # Secret AI Configuration
     # REFERENCE: secretAI-setting-up-environment.txt
-    secret_ai_api_key: str = Field(
-        default="",
-        env="SECRET_AI_API_KEY",
-        description="API key for Secret AI authentication"
-    )
-
-    secret_node_url: Optional[str] = Field(
-        default=None,
-        env="SECRET_NODE_URL",
-        description="Optional custom Secret Network node URL"
-    )
+    secret_ai_api_key: str = field(default="", repr=False)  # SECRET_AI_API_KEY (kept out of repr/logs)
+    secret_node_url: Optional[str] = None       # SECRET_NODE_URL
 
     # Secret AI Node Configuration (for model discovery)
-    secret_ai_node_url: Optional[str] = Field(
-        default=None,
-        env="SECRET_AI_NODE_URL",
-        description="LCD node URL for Secret AI model discovery"
-    )
-
-    secret_ai_chain_id: Optional[str] = Field(
-        default=None,
-        env="SECRET_AI_CHAIN_ID",
-        description="Secret Network chain ID (secret-4 for mainnet, pulsar-3 for testnet)"
-    )
-    
+    secret_ai_node_url: Optional[str] = None    # SECRET_AI_NODE_URL
+    secret_ai_chain_id: Optional[str] = None    # SECRET_AI_CHAIN_ID (secret-4 mainnet, pulsar-3 testnet)
+
     # Hub Configuration
-    hub_host: str = Field(
-        default="0.0.0.0",
-        env="SECRETGPT_HUB_HOST",
-        description="Host for the hub server"
-    )
-    
-    hub_port: int = Field(
-        default=8000,
-        env="SECRETGPT_HUB_PORT",
-        description="Port for the hub server"
-    )
-    
+    hub_host: str = "0.0.0.0"                   # SECRETGPT_HUB_HOST
+    hub_port: int = 8000                        # SECRETGPT_HUB_PORT
+
     # Web UI Configuration (Phase 2)
-    enable_web_ui: bool = Field(
-        default=False,
-        env="SECRETGPT_ENABLE_WEB_UI",
-        description="Enable web UI interface"
-    )
-    
-    
+    enable_web_ui: bool = False                 # SECRETGPT_ENABLE_WEB_UI
+
     # MCP Configuration (Phase 4)
-    mcp_enabled: bool = Field(
-        default=False,
-        env="MCP_ENABLED",
-        description="Enable MCP service integration"
-    )
-    
-    secret_mcp_url: str = Field(
-        default="http://host.docker.internal:8002",
-        env="SECRET_MCP_URL",
-        description="URL for external Secret Network MCP server"
-    )
-    
+    mcp_enabled: bool = False                   # MCP_ENABLED
+    secret_mcp_url: str = "http://host.docker.internal:8002"  # SECRET_MCP_URL
+
     # Removed: mcp_server_path - no longer needed with HTTP MCP integration
-    
+
     # Logging Configuration
-    log_level: str = Field(
-        default="INFO",
-        env="LOG_LEVEL",
-        description="Logging level (DEBUG, INFO, WARNING, ERROR)"
-    )
-    
+    log_level: str = "INFO"                     # LOG_LEVEL (DEBUG, INFO, WARNING, ERROR)
+
     # Development/Production Mode
-    environment: str = Field(
-        default="development",
-        env="ENVIRONMENT",
-        description="Environment mode (development, production)"
-    )
-    
-    model_config = {
-        "env_file": ".env",
-        "env_file_encoding": "utf-8",
-        "case_sensitive": False,
-        "extra": "ignore"
-    }
+    environment: str = "development"            # ENVIRONMENT (development, production)
 
+    @classmethod
+    def from_env(cls) -> "Settings":
+        """
+        Load settings from environment variables
 
-# Global settings instance
-settings = Settings()
+        Variable names match case-insensitively. Call load_env_file() first
+        (get_settings() does) so .env values are visible.
+        """
+        return cls(
+            secret_ai_api_key=_env("SECRET_AI_API_KEY", ""),
+            secret_node_url=_env("SECRET_NODE_URL"),
+            secret_ai_node_url=_env("SECRET_AI_NODE_URL"),
+            secret_ai_chain_id=_env("SECRET_AI_CHAIN_ID"),
+            hub_host=_env("SECRETGPT_HUB_HOST", "0.0.0.0"),
+            hub_port=int(_env("SECRETGPT_HUB_PORT", "8000")),
+            enable_web_ui=_env_bool("SECRETGPT_ENABLE_WEB_UI", False),
+            mcp_enabled=_env_bool("MCP_ENABLED", False),
+            secret_mcp_url=_env("SECRET_MCP_URL", "http://host.docker.internal:8002"),
+            log_level=_env("LOG_LEVEL", "INFO"),
+            environment=_env("ENVIRONMENT", "development"),
+        )
 
 
-def validate_settings() -> bool:
+def _read_env_file(path: str = ENV_FILE) -> Dict[str, str]:
     """
-    Validate that required settings are present
+    Parse a .env file into a dict with a single read
+
+    Supports KEY=VALUE lines, an optional "export " prefix, quoted values
+    and full-line or trailing " #" comments. A missing file yields {}.
+    """
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError:
+        return {}
+
+    values = {}
+    for raw_line in data.decode("utf-8").splitlines():
+        line = raw_line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith("export "):
+            line = line[7:].lstrip()
+        key, sep, value = line.partition("=")
+        if not sep:
+            continue
+        key = key.strip()
+        value = value.strip()
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in ("'", '"'):
+            value = value[1:-1]
+        else:
+            value = value.split(" #", 1)[0].rstrip()
+        values[key] = value
+    return values
+
+
+def load_env_file(path: str = ENV_FILE) -> None:
+    """
+    Export a .env file into os.environ, once per process
+
+    Variables already present in the environment take precedence, and later
+    calls are no-ops, so the file is parsed a single time no matter how many
+    entry points ask for it.
+    """
+    global _env_file_loaded
+    if _env_file_loaded:
+        return
+    _env_file_loaded = True
+    for key, value in _read_env_file(path).items():
+        os.environ.setdefault(key, value)
+
+
+def _env(name: str, default: Optional[str] = None) -> Optional[str]:
+    """Read a variable from the environment, matching the name case-insensitively"""
+    value = os.environ.get(name)
+    if value is None:
+        upper = name.upper()
+        value = next((v for k, v in os.environ.items() if k.upper() == upper), None)
+    return default if value is None else value
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    """Read a boolean variable"""
+    value = _env(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get the application settings, loading them on first use
+
+    The .env file is exported into the environment (if no entry point has
+    done so already) and the settings are parsed once per process; later
+    calls return the cached instance.
 
     Returns:
-        bool: True if all required settings are valid
+        Settings: The application settings
     """
-    import logging
-    logger = logging.getLogger(__name__)
-
-    logger.info("Validating configuration settings...")
-    logger.info(f"SECRET_AI_API_KEY: {'set' if settings.secret_ai_api_key else 'not set'}")
-    logger.info(f"SECRETGPT_ENABLE_WEB_UI: {settings.enable_web_ui}")
-    logger.info(f"SECRETGPT_HUB_HOST: {settings.hub_host}")
-    logger.info(f"SECRETGPT_HUB_PORT: {settings.hub_port}")
-    logger.info(f"ENVIRONMENT: {settings.environment}")
-    logger.info(f"LOG_LEVEL: {settings.log_level}")
-
-    # Phase 1: Only Secret AI API key is required
+    load_env_file()
+    return Settings.from_env()
+
+
+def __getattr__(name: str):
+    """
+    Lazily resolve the deprecated module-level ``settings`` instance (PEP 562)
+
+    Existing ``from config.settings import settings`` imports keep working,
+    but Settings is only built when that name is actually requested.
+    """
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _check_secret_ai_api_key(settings: Settings) -> Optional[str]:
+    """Phase 1: Only Secret AI API key is required"""
     if not settings.secret_ai_api_key or settings.secret_ai_api_key == "PLEASE_SET_IN_USR_DOT_ENV":
-        logger.warning("SECRET_AI_API_KEY not set! Please create usr/.env file with your API key.")
-        logger.warning("Copy .env.example to usr/.env and update with your values.")
-        # Allow hub to start without API key for now
-        return True
+        return ("SECRET_AI_API_KEY not set! Please create usr/.env file with your API key. "
+                "Copy .env.example to usr/.env and update with your values.")
+    return None
+
+
+# Runtime checks, built once at import. Each returns a warning message or None.
+# Phase 1: MCP is optional - no check for SECRET_MCP_URL, the hub continues
+# if the MCP server is unavailable.
+_VALIDATORS: Tuple[Callable[[Settings], Optional[str]], ...] = (
+    _check_secret_ai_api_key,
+)
 
 
-    # Phase 1: MCP is optional - hub can run without it
-    # No validation needed for SECRET_MCP_URL - hub continues if MCP server unavailable
+@lru_cache(maxsize=1)
+def validate_settings() -> bool:
+    """
+    Validate that required settings are present
+
+    Field defaults and environment wiring are checked statically by
+    tools/validate_settings.py (pre-commit), so only runtime values are
+    checked here. Settings are immutable once loaded, so the result is
+    computed once and cached.
+
+    Returns:
+        bool: True if all required settings are valid
+    """
+    settings = get_settings()
+    logger.info("Configuration: %s", settings)
 
-    logger.info("Configuration validation complete")
-    return True
\ No newline at end of file
+    for validator in _VALIDATORS:
+        warning = validator(settings)
+        if warning:
+            # Allow hub to start without API key for now
+            logger.warning(warning)
+    return True
@@ -3,23 +3,327 @@ Hub Router - Central message routing and component management
 Implements the core hub architecture for secretGPT
 """
 import asyncio
+import json
 import logging
 import re
-from typing import Dict, Any, Optional, Callable, List, AsyncGenerator
-from enum import Enum
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Optional, List, AsyncGenerator, Mapping, Tuple
+from enum import IntEnum
 
 logger = logging.getLogger(__name__)
 
+# Response memoization for deterministic (low temperature) route_message calls
+RESPONSE_CACHE_MAX_SIZE = 256
+RESPONSE_CACHE_TTL = 60.0            # seconds
+RESPONSE_CACHE_MAX_TEMPERATURE = 0.1
+RESPONSE_CACHE_MIN_LATENCY = 0.1     # only cache responses slower than this (seconds)
+
+# System prompt contents that make an answer per-user or time-dependent
+# (wallet addresses, dates, clock times); such calls are never cached
+RESPONSE_CACHE_VOLATILE_PROMPT_PATTERN = re.compile(
+    r'secret1[a-z0-9]{38}|\d{4}-\d{2}-\d{2}|\b\d{1,2}:\d{2}\b'
+)
+
+# How long the MCP tool list is reused by the LLM layer before re-querying
+TOOLS_CACHE_TTL = 30.0               # seconds
+
+# How long a successful wallet balance lookup is reused for the same address
+BALANCE_CACHE_TTL = 5.0              # seconds
+BALANCE_CACHE_MAX_SIZE = 1024
+
+# How long a healthy secret_network_status probe satisfies wallet connect/status checks
+NETWORK_STATUS_CACHE_TTL = 10.0      # seconds
+
+# Shared read-only stand-in for a missing options dict, so routing code can
+# call .get() unconditionally without allocating a dict per request
+_EMPTY_OPTIONS = MappingProxyType({})
+
+# Error payloads returned when no Secret AI component is registered; callers
+# copy these and add the interface (the nested chunk dict is shared, read-only)
+SECRET_AI_UNAVAILABLE_RESPONSE = {
+    "success": False,
+    "error": "Secret AI service not available"
+}
+SECRET_AI_UNAVAILABLE_CHUNK = {
+    **SECRET_AI_UNAVAILABLE_RESPONSE,
+    "chunk": {
+        "type": "stream_error",
+        "data": "Secret AI service not available",
+        "metadata": {"error": True}
+    }
+}
+
+# MCP tools without side effects; these may run concurrently with each other
+_READ_ONLY_TOOLS = frozenset({
+    "secret_network_status",
+    "secret_query_balance",
+    "secret_query_block",
+    "secret_query_transaction",
+    "secret_query_account",
+})
+
+# Metadata attached to every chunk of a streamed Keplr layer answer (shared,
+# read-only)
+KEPLR_CHUNK_METADATA = {"keplr_direct": True, "source": "keplr_layer"}
+
+# Static /mcp debug command responses
+MCP_DEBUG_HELP_TEXT = (
+    "Available MCP debug commands:\n"
+    "• /mcp status - Check MCP service status\n"
+    "• /mcp test - Test Secret Network connection\n"
+    "• /mcp tools - List available tools\n"
+    "• /mcp exec <tool_name> - Execute specific tool"
+)
+MCP_DEBUG_NOT_AVAILABLE_RESPONSE = {
+    "success": False,
+    "content": "❌ MCP service not available or not initialized",
+    "debug_command": True
+}
+
+# Secret Network query detection
+SECRET_ADDRESS_PATTERN = re.compile(r'secret1[a-z0-9]{38}')
+SCRT_AMOUNT_PATTERN = re.compile(r'(\d*\.?\d+)\s*(?:scrt|SCRT)', re.IGNORECASE)
+BLOCK_NUMBER_PATTERN = re.compile(r'block\s+(\d+)|block\s+#(\d+)|block\s+height\s+(\d+)')
+TX_HASH_PATTERN = re.compile(r'[a-fA-F0-9]{64}')  # 64-character hex string
+
+# Tool-call formats recognised in LLM responses by _extract_tool_calls: the
+# USE_TOOL instruction and the legacy JSON object, found in a single pass
+TOOL_CALL_PATTERN = re.compile(
+    r'(?P<use_tool>USE_TOOL:\s*(?P<tool>\w+)\s+with\s+arguments\s*(?P<args>\{[^}]*\}))'
+    r'|(?P<json>\{[^{}]*"tool_name"[^{}]*"arguments"[^{}]*\})',
+    re.IGNORECASE
+)
+LOOSE_SECRET_ADDRESS_PATTERN = re.compile(r'secret1[a-z0-9]+')
+
+# Native SCRT balance phrasings handled by the Keplr layer
+NATIVE_SCRT_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'how\s+m(?:uch|any|ch)\s+scrt(?!\w)',  # "how much scrt" but not "sscrt"
+    r'how\s+m(?:uch|any)\s+(?:do\s+)?i\s+have',
+    r'(?:what|whats|what\'s)\s+(?:is\s+)?my\s+scrt\s+balance',
+    r'(?:show|check|get)\s+my\s+scrt\s+balance',
+    r'my\s+scrt\s+balance',
+    r'my\s+scrt(?!\w)',  # "my scrt" but not "my sscrt"
+    r'balance\s+(?:of\s+)?(?:my|mine)',
+    r'(?<!s)scrt\s+balance',  # "scrt balance" but not "sscrt balance"
+))
+
+
+def _keyword_pattern(*keywords: str) -> "re.Pattern[str]":
+    """Compile literal keywords into one alternation, so a single search replaces any(k in text ...)"""
+    return re.compile("|".join(map(re.escape, keywords)))
+
+
+# Secret Network pre-detection only looks at the start of a message; intent
+# is stated up front, and this bounds the work for huge pasted inputs
+DETECTION_SCAN_LIMIT = 4096          # characters
+
+# Keyword groups for _detect_secret_network_queries (matched against the
+# lowercased message unless noted)
+SEND_KEYWORDS = _keyword_pattern('send', 'transfer', 'pay')
+SCRT_MENTION_KEYWORDS = _keyword_pattern('secret1', 'SCRT', 'scrt')  # original case
+BLOCK_INFO_KEYWORDS = _keyword_pattern(
+    'latest block', 'current block', 'recent block', 'block info',
+    'block information', 'block details', 'last block', 'newest block',
+    'block height', 'current height', 'latest height', 'what is the block height',
+    'get block height', 'show block height', 'block number'
+)
+NETWORK_KEYWORDS = _keyword_pattern(
+    'secret network', 'scrt network', 'chain info', 'network status',
+    'chain information', 'network info', 'secret chain', 'scrt chain',
+    'chain status', 'blockchain info', 'blockchain status'
+)
+STATUS_KEYWORDS = _keyword_pattern('status', 'info', 'information', 'details')
+BALANCE_OR_TX_KEYWORDS = _keyword_pattern('balance', 'transaction')
+TX_KEYWORDS = _keyword_pattern('transaction', 'tx', 'txhash', 'hash')
+ACCOUNT_KEYWORDS = _keyword_pattern(
+    'account info', 'address info', 'account details', 'address details',
+    'account number', 'sequence number'
+)
+TEST_PHRASE_KEYWORDS = _keyword_pattern(
+    'test secret network', 'test mcp connection', 'secret network test',
+    'check secret network', 'ping secret network', 'secret network status',
+    'is secret network working', 'secret network info'
+)
+GENERIC_NETWORK_KEYWORDS = _keyword_pattern('secret network', 'secret blockchain')
+QUESTION_KEYWORDS = _keyword_pattern('what', 'how', 'show', 'get', 'tell', 'info', 'status', 'current')
+PERSONAL_KEYWORDS = _keyword_pattern('my', 'balance', 'wallet', 'account', 'i have', 'scrt')
+
+# Keplr layer: at least one of these appears in every NATIVE_SCRT_PATTERNS
+# match and every SIMPLE_BALANCE_KEYWORDS match
+NATIVE_BALANCE_HINT_KEYWORDS = _keyword_pattern('scrt', 'have', 'balance', 'wallet')
+
+# Keplr layer: plain balance requests, unless a SNIP token is named
+SIMPLE_BALANCE_KEYWORDS = _keyword_pattern('my balance', 'my wallet', 'check balance', 'show balance')
+SNIP_TOKEN_KEYWORDS = _keyword_pattern('sscrt', 'stkd', 'shd', 'sienna', 'alter', 'button')
+
+# Smart filter: messages mentioning any of these always go through the
+# blockchain layers
+BLOCKCHAIN_KEYWORDS = _keyword_pattern(
+    'scrt', 'secret network', 'secret', 'balance', 'wallet', 'keplr',
+    'transaction', 'transfer', 'send', 'tokens', 'crypto', 'blockchain',
+    'contract', 'gas', 'fee', 'address', 'secret1', 'block', 'chain'
+)
+
+# Smart filter: general greetings and conversation starters
+GENERAL_QUERY_PREFIXES = (
+    # Greetings
+    'hello', 'hi', 'hey', 'good morning', 'good afternoon', 'good evening',
+    'how are you', 'whats up', "what's up", 'how is it going',
+
+    # General questions
+    'what is', 'what are', 'how do', 'how does', 'explain', 'tell me about',
+    'can you', 'could you', 'would you', 'will you',
+
+    # Programming/general help (not blockchain specific)
+    'help me with', 'how to', 'write code', 'create a', 'build a',
+    'python', 'javascript', 'react', 'html', 'css',
+
+    # General knowledge
+    'who is', 'where is', 'when did', 'why does', 'what does',
+    'calculate', 'solve', 'find the', 'what time',
+)
+
+# Keyword fallbacks for LLM responses without an explicit tool call
+RESPONSE_NETWORK_KEYWORDS = _keyword_pattern('chain info', 'network status', 'chain information', 'network info')
+RESPONSE_BLOCK_KEYWORDS = _keyword_pattern('latest block', 'current block', 'block info')
+
+# MCP debug commands: "/mcp ...", "mcp ..." or one of the bare aliases
+_MCP_CMD_RE = re.compile(r'/mcp(?:\s|$)|mcp\s', re.IGNORECASE)
+_MCP_ALIASES = frozenset({'mcp test', 'mcp status', 'mcp tools', 'test mcp', 'mcp help'})
+
+
+def _normalize_mcp_command(stripped: str) -> Optional[str]:
+    """
+    Return the canonical "/mcp <args>" form of an MCP debug command
+
+    Takes the already-stripped message; returns None if it is not an MCP
+    debug command.
+    """
+    if stripped.startswith('/'):
+        return stripped if _MCP_CMD_RE.match(stripped) else None
+    lowered = stripped.lower()
+    if not (_MCP_CMD_RE.match(lowered) or lowered in _MCP_ALIASES):
+        return None
+    return f"/mcp {lowered.replace('mcp ', '').replace('test mcp', 'test').strip()}"
+
+
+def _is_cacheable_response(response: Dict[str, Any]) -> bool:
+    """
+    Whether a route_message response may be memoized
+
+    Only successful LLM answers qualify: MCP layer results and LLM answers
+    that executed tools carry live chain data.
+    """
+    return (
+        bool(response.get("success"))
+        and response.get("source") in (None, "llm_direct")
+        and "tools_used" not in response
+        and "tool_results" not in response
+    )
+
+
+def _describe_detected_tool_call(tool_call: Dict[str, Any]) -> str:
+    """Human-readable summary of a pre-detected tool call for the routing log"""
+    name = tool_call["name"]
+    args = tool_call["arguments"]
+    if name == "secret_send_tokens":
+        return f"Send transaction - {args['amount']} SCRT from {args['from_address']} to {args['to_address']}"
+    if name == "secret_query_balance":
+        return f"Balance query for address {args['address']}"
+    if name == "secret_query_block":
+        if "height" in args:
+            return f"Specific block query for height {args['height']}"
+        return "Block information query"
+    if name == "secret_network_status":
+        return "Secret Network status query"
+    if name == "secret_query_transaction":
+        return f"Transaction query for hash {args['txHash'][:16]}..."
+    if name == "secret_query_account":
+        return f"Account query for address {args['address']}"
+    return f"{name} with {args}"
+
+
+@lru_cache(maxsize=4)
+def _tool_prompt_block(tools: Tuple[Tuple[str, str], ...]) -> str:
+    """
+    Render the system-prompt suffix describing the available MCP tools
+
+    Cached on the (name, description) pairs: the tool list rarely changes,
+    so the multi-KB block is built once rather than on every LLM request.
+    """
+    tool_descriptions = "\n".join(f"- {name}: {description}" for name, description in tools)
+    return f"""\n\n🔗 **IMPORTANT: Secret Network Data Access**
+
+You have access to real-time Secret Network blockchain tools:
+{tool_descriptions}
+
+**CRITICAL**: When users ask about Secret Network/SCRT blockchain data, you MUST use these tools because:
+1. Blockchain data changes constantly (new blocks, transactions, balances)
+2. You cannot provide accurate current information without real-time queries
+3. Users expect live, accurate blockchain data, not outdated information
+
+**When to use tools** (be aggressive about this):
+- ANY question about Secret Network status, chain info, network details
+- ANY balance inquiry (even if just mentioning "balance" + Secret Network)
+- ANY block information (latest, specific height, recent blocks)
+- ANY transaction lookup or account details
+- ANY contract state queries
+
+**How to use tools**:
+Respond with: USE_TOOL: tool_name with arguments {{...}}
 
-class ComponentType(Enum):
+**Examples**:
+- "What's the Secret Network status?" → USE_TOOL: secret_network_status with arguments {{}}
+- "Check balance for secret1abc..." → USE_TOOL: secret_query_balance with arguments {{"address": "secret1abc..."}}
+- "Latest block info?" → USE_TOOL: secret_query_block with arguments {{}}
+- "Chain information?" → USE_TOOL: secret_network_status with arguments {{}}
+
+**Remember**: Always prioritize tool usage for Secret Network queries over general knowledge."""
+
+
+@lru_cache(maxsize=16)
+def _tool_system_prompt(system_prompt: str, tools: Tuple[Tuple[str, str], ...]) -> str:
+    """Return the base system prompt with the tool block appended, built in one concatenation"""
+    return f"{system_prompt}{_tool_prompt_block(tools)}"
+
+
+class ComponentType(IntEnum):
     """Types of components that can register with the hub"""
-    SECRET_AI = "secret_ai"
-    WEB_UI = "web_ui"
-    MCP_SERVICE = "mcp_service"
-    MULTI_UI_SERVICE = "multi_ui_service"
-    SECRET_GPTEE_UI = "secret_gptee_ui"
-    WALLET_PROXY = "wallet_proxy"
-    SNIP_TOKEN_SERVICE = "snip_token_service"
+    SECRET_AI = 0
+    WEB_UI = 1
+    MCP_SERVICE = 2
+    MULTI_UI_SERVICE = 3
+    SECRET_GPTEE_UI = 4
+    WALLET_PROXY = 5
+    SNIP_TOKEN_SERVICE = 6
+
+    @property
+    def label(self) -> str:
+        """String name used in logs and status reports"""
+        return _COMPONENT_LABELS[self]
+
+
+# Indexed by ComponentType value
+_COMPONENT_LABELS = (
+    "secret_ai",
+    "web_ui",
+    "mcp_service",
+    "multi_ui_service",
+    "secret_gptee_ui",
+    "wallet_proxy",
+    "snip_token_service",
+)
+
+
+@dataclass(slots=True)
+class LayerResult:
+    """Outcome of the Keplr and MCP layers of the routing priority chain"""
+    kind: str  # "keplr", "mcp" or "llm"
+    payload: Any
 
 
 class HubRouter:
@@ -28,11 +332,33 @@ class HubRouter:
     Manages all communication between interfaces and services
     """
     
+    # Fixed attribute set: no per-instance __dict__, faster attribute loads
+    __slots__ = (
+        "components",
+        "_secret_ai",
+        "_mcp_service",
+        "initialized",
+        "_response_cache",
+        "_tools_cache",
+        "_tools_cache_expiry",
+        "_balance_cache",
+        "_http_session",
+        "_network_status_cache",
+    )
+    
     def __init__(self):
         """Initialize the hub router with component registry"""
         self.components: Dict[ComponentType, Any] = {}
-        self.message_handlers: Dict[str, Callable] = {}
+        # Secret AI and MCP resolved once at registration for the per-message paths
+        self._secret_ai: Optional[Any] = None
+        self._mcp_service: Optional[Any] = None
         self.initialized = False
+        self._response_cache: "OrderedDict[Tuple, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._tools_cache: List[Dict[str, Any]] = []
+        self._tools_cache_expiry = 0.0
+        self._balance_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._http_session: Optional[Any] = None  # aiohttp.ClientSession, created on first use
+        self._network_status_cache: Optional[Tuple[float, Dict[str, Any]]] = None
         logger.info("Hub Router initialized")
     
     def register_component(self, component_type: ComponentType, component: Any) -> None:
@@ -44,7 +370,13 @@ class HubRouter:
             component: The component instance
         """
         self.components[component_type] = component
-        logger.info(f"Registered component: {component_type.value}")
+        if component_type is ComponentType.SECRET_AI:
+            self._secret_ai = component
+        elif component_type is ComponentType.MCP_SERVICE:
+            self._mcp_service = component
+            self._tools_cache_expiry = 0.0
+            self._network_status_cache = None
+        logger.info(f"Registered component: {component_type.label}")
     
     def get_component(self, component_type: ComponentType) -> Optional[Any]:
         """
@@ -70,153 +402,208 @@ class HubRouter:
         Returns:
             Dict containing the response and metadata
         """
-        logger.info(f"Routing message from {interface} (length: {len(message)} chars)")
-        
-        # DEBUG: Log the exact message received
-        logger.info(f"DEBUG: Raw message received: '{message}'")
-        logger.info(f"DEBUG: Message starts with '/mcp': {message.strip().startswith('/mcp')}")
-        
-        # Handle debug commands first (bypass AI) - support multiple formats
-        message_clean = message.strip().lower()
-        logger.info(f"DEBUG: Cleaned message: '{message_clean}'")
-        
-        if (message.strip().startswith('/mcp') or 
-            message_clean.startswith('mcp ') or
-            message_clean in ['mcp test', 'mcp status', 'mcp tools', 'test mcp', 'mcp help']):
-            # Normalize the command format
-            logger.info(f"DEBUG: MCP command detected! Processing...")
-            if not message.strip().startswith('/'):
-                normalized_cmd = f"/mcp {message_clean.replace('mcp ', '').replace('test mcp', 'test').strip()}"
-            else:
-                normalized_cmd = message.strip()
-            logger.info(f"DEBUG: Normalized command: '{normalized_cmd}'")
-            return await self._handle_mcp_debug_command(normalized_cmd, interface)
-        
-        logger.info(f"DEBUG: Not an MCP command, proceeding with smart routing...")
+        cache_key = self._response_cache_key(interface, message, options)
+        if cache_key is not None:
+            cached = self._get_cached_response(cache_key)
+            if cached is not None:
+                logger.info(f"Returning cached response for {interface} message")
+                return cached
 
-        # SMART FILTER: Check if this is obviously a general AI query that should skip blockchain layers
-        if self._is_general_ai_query(message):
-            logger.info(f"🤖 SMART FILTER: Detected general AI query, routing directly to LLM layer")
-            return await self._route_to_llm_layer(interface, message, options)
+        started = time.monotonic()
+        response = await self._route_message(interface, message, options)
 
-        logger.info(f"DEBUG: Not a general AI query, proceeding with Keplr → MCP → LLM priority chain")
+        if (cache_key is not None and _is_cacheable_response(response)
+                and time.monotonic() - started >= RESPONSE_CACHE_MIN_LATENCY):
+            self._cache_response(cache_key, response)
 
-        # LAYER 1: Check Keplr wallet data first (highest priority)
-        wallet_connected = options.get("wallet_connected", False) if options else False
-        wallet_address = options.get("wallet_address") if options else None
+        return response
+
+    def _response_cache_key(self, interface: str, message: str, options: Optional[Dict[str, Any]]) -> Optional[Tuple]:
+        """
+        Build the memoization key for a route_message call
+
+        Returns:
+            Hashable key, or None if the call must not be cached
+        """
+        if not options:
+            return None
+
+        # Only deterministic calls are cacheable
+        temperature = options.get("temperature", 1.0)
+        if not isinstance(temperature, (int, float)) or temperature > RESPONSE_CACHE_MAX_TEMPERATURE:
+            return None
+
+        # Wallet-scoped answers depend on live per-user state
+        if options.get("wallet_connected"):
+            return None
+
+        system_prompt = options.get("system_prompt")
+        if isinstance(system_prompt, str) and RESPONSE_CACHE_VOLATILE_PROMPT_PATTERN.search(system_prompt):
+            return None
+
+        # Debug commands report live MCP state
+        if _normalize_mcp_command(message.strip()) is not None:
+            return None
+
+        try:
+            return (interface, message, frozenset(options.items()))
+        except TypeError:
+            # Unhashable option values (viewing keys, permits, ...)
+            return None
+
+    def _get_cached_response(self, cache_key: Tuple) -> Optional[Dict[str, Any]]:
+        """Get a cached response if present and not expired"""
+        entry = self._response_cache.get(cache_key)
+        if entry is None:
+            return None
+
+        cached_at, response = entry
+        if time.monotonic() - cached_at > RESPONSE_CACHE_TTL:
+            del self._response_cache[cache_key]
+            return None
+
+        self._response_cache.move_to_end(cache_key)
+        return dict(response)
+
+    def _cache_response(self, cache_key: Tuple, response: Dict[str, Any]) -> None:
+        """Cache a response, evicting the least recently used entry when full"""
+        if len(self._response_cache) >= RESPONSE_CACHE_MAX_SIZE:
+            self._response_cache.popitem(last=False)
+        self._response_cache[cache_key] = (time.monotonic(), dict(response))
+
+    async def _resolve_layers(self, message: str, message_lower: str, opts: Mapping[str, Any], options: Optional[Dict[str, Any]]) -> LayerResult:
+        """
+        Run the Keplr and MCP layers of the priority chain
+        
+        Shared by route_message and stream_message, which only differ in how
+        they present the result. message_lower is message.lower(), computed
+        once by the caller and shared by both layers.
+        
+        Returns:
+            LayerResult of kind "keplr" (payload: Keplr response dict), "mcp"
+            (payload: (tool names, formatted tool summary)) or "llm" (payload:
+            pre-detected tool calls, possibly empty, for the LLM layer)
+        """
+        wallet_connected = opts.get("wallet_connected", False)
+        wallet_address = opts.get("wallet_address")
         
-        logger.info(f"📥 Full options received: {options}")
-        logger.info(f"🔵 KEPLR LAYER: wallet_connected={wallet_connected}, wallet_address={wallet_address}")
+        logger.debug("📥 Full options received: %s", options)
+        logger.debug("🔵 KEPLR LAYER: wallet_connected=%s, wallet_address=%s", wallet_connected, wallet_address)
         
+        # Secret Network pre-detection is CPU-only and independent of the Keplr
+        # layer, so run it up front; MCP tools only execute if Keplr declines
+        logger.debug("🟠 MCP LAYER: Checking for Secret Network queries...")
+        forced_tool_calls = self._detect_secret_network_queries(message, message_lower, wallet_address)
+        
+        # LAYER 1: Check Keplr wallet data first (highest priority)
         if wallet_connected and wallet_address:
-            logger.info(f"🔵 KEPLR LAYER: Checking if Keplr can handle query...")
-            keplr_response = await self._check_keplr_data(message, wallet_connected, wallet_address, options)
+            logger.debug("🔵 KEPLR LAYER: Checking if Keplr can handle query...")
+            keplr_response = await self._check_keplr_data(message, message_lower, wallet_connected, wallet_address, options)
             if keplr_response:
-                logger.info(f"🔵 KEPLR LAYER: Query handled directly by Keplr layer")
-                return keplr_response
-            else:
-                logger.info(f"🔵 KEPLR LAYER: Cannot handle query, passing to MCP layer")
+                logger.debug("🔵 KEPLR LAYER: Query handled directly by Keplr layer")
+                return LayerResult("keplr", keplr_response)
+            logger.debug("🔵 KEPLR LAYER: Cannot handle query, passing to MCP layer")
         else:
-            logger.info(f"🔵 KEPLR LAYER: Wallet not connected, skipping to MCP layer")
+            logger.debug("🔵 KEPLR LAYER: Wallet not connected, skipping to MCP layer")
         
-        # LAYER 2: Check MCP/Secret Network queries (medium priority) 
-        logger.info(f"🟠 MCP LAYER: Checking for Secret Network queries...")
-        forced_tool_calls = self._detect_secret_network_queries(message, wallet_address)
+        # LAYER 2: MCP/Secret Network queries (medium priority) 
         if forced_tool_calls:
-            logger.info(f"🟠 MCP LAYER: Secret Network query detected, executing tools: {[tc['name'] for tc in forced_tool_calls]}")
+            tool_names = [tc['name'] for tc in forced_tool_calls]
+            logger.debug("🟠 MCP LAYER: Secret Network query detected, executing tools: %s", tool_names)
             
             # Execute MCP tools and return result
             try:
                 tool_results = await self._execute_tools(forced_tool_calls)
                 
                 # Format tool results for display
-                tool_summary = "\n\n".join([
-                    f"**{result['tool']}**: " + 
-                    (self._format_tool_result(result['result']) if result['success'] else f"Error - {result['error']}")
+                tool_summary = "\n\n".join(
+                    f"**{result['tool']}**: {self._format_tool_result(result['result']) if result['success'] else 'Error - ' + result['error']}"
                     for result in tool_results
-                ])
+                )
                 
-                return {
-                    "success": True,
-                    "content": f"🔗 **Secret Network Tool Results**\n\n{tool_summary}",
-                    "interface": interface,
-                    "model": "mcp_service",
-                    "source": "mcp_layer",
-                    "tools_used": [tc['name'] for tc in forced_tool_calls]
-                }
+                return LayerResult("mcp", (tool_names, tool_summary))
                 
             except Exception as e:
                 logger.error(f"🟠 MCP LAYER: Tool execution failed: {e}")
                 # Fall through to LLM layer
-                logger.info(f"🟠 MCP LAYER: Failed, passing to LLM layer")
+                logger.debug("🟠 MCP LAYER: Failed, passing to LLM layer")
         else:
-            logger.info(f"🟠 MCP LAYER: No Secret Network queries detected, passing to LLM layer")
+            logger.debug("🟠 MCP LAYER: No Secret Network queries detected, passing to LLM layer")
+        
+        return LayerResult("llm", forced_tool_calls)
+    
+    async def _route_message(self, interface: str, message: str, options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Route a message through the debug command, Keplr, MCP and LLM layers"""
+        logger.info("Routing message from %s (length: %d chars)", interface, len(message))
+        
+        # DEBUG: Log the exact message received
+        logger.debug("Raw message received: '%s'", message)
+        stripped = message.strip()
+        
+        # Handle debug commands first (bypass AI) - support multiple formats
+        normalized_cmd = _normalize_mcp_command(stripped)
+        if normalized_cmd is not None:
+            logger.debug("MCP command detected! Processing...")
+            logger.debug("Normalized command: '%s'", normalized_cmd)
+            return await self._handle_mcp_debug_command(normalized_cmd, interface)
+        
+        logger.debug("Not an MCP command, proceeding with smart routing...")
+        message_lower = message.lower()
+
+        # SMART FILTER: Check if this is obviously a general AI query that should skip blockchain layers
+        if self._is_general_ai_query(message_lower.strip()):
+            logger.debug("🤖 SMART FILTER: Detected general AI query, routing directly to LLM layer")
+            return await self._route_to_llm_layer(interface, message, options)
+
+        logger.debug("Not a general AI query, proceeding with Keplr → MCP → LLM priority chain")
+
+        # LAYERS 1-2: Keplr wallet data, then MCP/Secret Network tools
+        opts = options or _EMPTY_OPTIONS
+        layer = await self._resolve_layers(message, message_lower, opts, options)
+        if layer.kind == "keplr":
+            return layer.payload
+        if layer.kind == "mcp":
+            tool_names, tool_summary = layer.payload
+            return {
+                "success": True,
+                "content": f"🔗 **Secret Network Tool Results**\n\n{tool_summary}",
+                "interface": interface,
+                "model": "mcp_service",
+                "source": "mcp_layer",
+                "tools_used": tool_names
+            }
+        forced_tool_calls = layer.payload
         
         # LAYER 3: Use LLM for general questions (lowest priority)
-        logger.info(f"🟢 LLM LAYER: Handling general query with AI...")
+        logger.debug("🟢 LLM LAYER: Handling general query with AI...")
         
         # Get Secret AI service
-        secret_ai = self.get_component(ComponentType.SECRET_AI)
+        secret_ai = self._secret_ai
         if not secret_ai:
             logger.error("🟢 LLM LAYER: Secret AI service not registered")
-            return {
-                "success": False,
-                "error": "Secret AI service not available",
-                "interface": interface
-            }
+            return {**SECRET_AI_UNAVAILABLE_RESPONSE, "interface": interface}
         
         try:
-            # Use default options if not provided
-            if options is None:
-                options = {}
-            
             # Check if tools are enabled and available
-            enable_tools = options.get("enable_tools", True)
+            enable_tools = opts.get("enable_tools", True)
             available_tools = []
             
             if enable_tools:
-                mcp_service = self.get_component(ComponentType.MCP_SERVICE)
+                mcp_service = self._mcp_service
                 if mcp_service and mcp_service.initialized:
                     try:
-                        available_tools = await mcp_service.get_available_tools()
-                        logger.info(f"Found {len(available_tools)} MCP tools available")
+                        available_tools = await self._get_available_tools(mcp_service)
+                        logger.debug("Found %s MCP tools available", len(available_tools))
                     except Exception as e:
                         logger.warning(f"Failed to get MCP tools: {e}")
             
             # Enhance system prompt with tool information if available
-            system_prompt = options.get("system_prompt", "You are a helpful assistant.")
+            system_prompt = opts.get("system_prompt", "You are a helpful assistant.")
             if available_tools:
-                tool_descriptions = "\n".join([
-                    f"- {tool['name']}: {tool['description']}"
-                    for tool in available_tools
-                ])
-                system_prompt += f"""\n\n🔗 **IMPORTANT: Secret Network Data Access**
-
-You have access to real-time Secret Network blockchain tools:
-{tool_descriptions}
-
-**CRITICAL**: When users ask about Secret Network/SCRT blockchain data, you MUST use these tools because:
-1. Blockchain data changes constantly (new blocks, transactions, balances)
-2. You cannot provide accurate current information without real-time queries
-3. Users expect live, accurate blockchain data, not outdated information
-
-**When to use tools** (be aggressive about this):
-- ANY question about Secret Network status, chain info, network details
-- ANY balance inquiry (even if just mentioning "balance" + Secret Network)
-- ANY block information (latest, specific height, recent blocks)
-- ANY transaction lookup or account details
-- ANY contract state queries
-
-**How to use tools**:
-Respond with: USE_TOOL: tool_name with arguments {{...}}
-
-**Examples**:
-- "What's the Secret Network status?" → USE_TOOL: secret_network_status with arguments {{}}
-- "Check balance for secret1abc..." → USE_TOOL: secret_query_balance with arguments {{"address": "secret1abc..."}}
-- "Latest block info?" → USE_TOOL: secret_query_block with arguments {{}}
-- "Chain information?" → USE_TOOL: secret_network_status with arguments {{}}
-
-**Remember**: Always prioritize tool usage for Secret Network queries over general knowledge."""
+                system_prompt = _tool_system_prompt(
+                    system_prompt,
+                    tuple((tool['name'], tool['description']) for tool in available_tools)
+                )
             
             # Format messages using Secret AI's helper method
             messages = secret_ai.format_messages(system_prompt, message)
@@ -225,18 +612,22 @@ Respond with: USE_TOOL: tool_name with arguments {{...}}
             response = await secret_ai.ainvoke(messages)
             
             # Check if AI response requests tool usage OR if we pre-detected them
-            tool_calls = self._extract_tool_calls(response)
+            # (skip scanning the response entirely when tools are disabled)
+            tool_calls = self._extract_tool_calls(response) if enable_tools else []
             
             # Use forced tool calls if available (more aggressive detection)
             if forced_tool_calls and enable_tools:
-                logger.info(f"🎯 Using pre-detected tool calls instead of AI extraction")
-                logger.info(f"🔍 Forced tools: {[tc['name'] for tc in forced_tool_calls]}")
                 tool_calls = forced_tool_calls
-            elif tool_calls:
-                logger.info(f"🤖 AI requested tool calls: {[tc['name'] for tc in tool_calls]}")
+                tool_names = [tc['name'] for tc in tool_calls]
+                logger.debug("🎯 Using pre-detected tool calls instead of AI extraction")
+                logger.debug("🔍 Forced tools: %s", tool_names)
+            else:
+                tool_names = [tc['name'] for tc in tool_calls]
+                if tool_names:
+                    logger.debug("🤖 AI requested tool calls: %s", tool_names)
             
             if tool_calls and enable_tools:
-                logger.info(f"🛠️ TRIGGERING MCP TOOLS: {', '.join([tc['name'] for tc in tool_calls])}")
+                logger.debug("🛠️ TRIGGERING MCP TOOLS: %s", ', '.join(tool_names))
                 # Execute tools via MCP service
                 tool_results = await self._execute_tools(tool_calls)
                 
@@ -247,14 +638,14 @@ Respond with: USE_TOOL: tool_name with arguments {{...}}
                 
                 # Add interface metadata
                 enhanced_response["interface"] = interface
-                enhanced_response["options"] = options
-                enhanced_response["tools_used"] = [call["name"] for call in tool_calls]
+                enhanced_response["options"] = options or {}
+                enhanced_response["tools_used"] = tool_names
                 
                 return enhanced_response
             
             # Add interface metadata
             response["interface"] = interface
-            response["options"] = options
+            response["options"] = options or {}
             
             return response
             
@@ -273,7 +664,7 @@ Respond with: USE_TOOL: tool_name with arguments {{...}}
         Returns:
             List of available model names
         """
-        secret_ai = self.get_component(ComponentType.SECRET_AI)
+        secret_ai = self._secret_ai
         if not secret_ai:
             return []
         
@@ -291,138 +682,87 @@ Respond with: USE_TOOL: tool_name with arguments {{...}}
         Yields:
             Dict containing streaming chunks and metadata
         """
-        logger.info(f"Streaming message from {interface} (length: {len(message)} chars)")
+        logger.info("Streaming message from %s (length: %d chars)", interface, len(message))
         
         # DEBUG: Log the exact message received for streaming
-        logger.info(f"DEBUG STREAM: Raw message received: '{message}'")
-        logger.info(f"DEBUG STREAM: Message starts with '/mcp': {message.strip().startswith('/mcp')}")
-        
-        # Handle debug commands first (bypass AI) - support multiple formats
-        message_clean = message.strip().lower()
-        logger.info(f"DEBUG STREAM: Cleaned message: '{message_clean}'")
+        logger.debug("Raw message received: '%s'", message)
+        stripped = message.strip()
+        message_lower = message.lower()
         
         # SMART FILTER: Check if this is obviously a general AI query that should skip blockchain layers
-        if self._is_general_ai_query(message):
-            logger.info(f"🤖 SMART FILTER STREAM: Detected general AI query, routing directly to LLM layer")
+        if self._is_general_ai_query(message_lower.strip()):
+            logger.debug("🤖 SMART FILTER STREAM: Detected general AI query, routing directly to LLM layer")
             async for chunk in self._stream_to_llm_layer(interface, message, options):
                 yield chunk
             return
 
-        logger.info(f"DEBUG STREAM: Not a general AI query, proceeding with Keplr → MCP → LLM priority chain")
-
-        print("🚨🚨🚨 CRITICAL: Reached priority chain implementation - PRINT VERSION")
-        logger.info("🚨🚨🚨 CRITICAL: Reached priority chain implementation")
-
-        # Implement Keplr → MCP → LLM priority chain for streaming
-        logger.info("🔥 BEFORE WALLET OPTIONS EXTRACTION")
-        if options is None:
-            logger.info("🔥 OPTIONS is NONE!")
-        else:
-            logger.info("🔥 OPTIONS is NOT NONE")
-        wallet_connected = options.get("wallet_connected", False) if options else False
-        wallet_address = options.get("wallet_address") if options else None
-        logger.info("🔥 AFTER WALLET OPTIONS EXTRACTION")
+        logger.debug("Not a general AI query, proceeding with Keplr → MCP → LLM priority chain")
 
-        logger.info(f"🚨 CRITICAL DEBUG STREAM: wallet_connected={wallet_connected}, wallet_address={wallet_address}")
-
-        # LAYER 1: Check Keplr wallet data first
-        if wallet_connected and wallet_address:
-            logger.info(f"🔵 KEPLR LAYER STREAM: Checking if Keplr can handle query...")
-            keplr_response = await self._check_keplr_data(message, wallet_connected, wallet_address, options)
-            if keplr_response:
-                logger.info(f"🔵 KEPLR LAYER STREAM: Query handled directly by Keplr layer")
-                
-                # Stream the content progressively like other responses
-                content = keplr_response["content"]
-                
-                # Send content in chunks to simulate streaming
-                chunk_size = 50  # Characters per chunk
-                for i in range(0, len(content), chunk_size):
-                    chunk_text = content[i:i + chunk_size]
-                    yield {
-                        "success": True,
-                        "chunk": {
-                            "type": "content",  # Use 'content' type for consistency
-                            "data": chunk_text,
-                            "metadata": {"keplr_direct": True, "source": "keplr_layer"}
-                        },
-                        "interface": interface,
-                        "model": "keplr_wallet",
-                        "stream_id": f"keplr_{hash(content) % 10000}"
-                    }
-                    
-                    # Small delay to make streaming visible
-                    import asyncio
-                    await asyncio.sleep(0.05)
-                
-                # Send stream completion signal
-                yield {
-                    "success": True,
-                    "chunk": {
-                        "type": "stream_complete",
-                        "data": "",
-                        "metadata": {"completed": True}
-                    },
-                    "interface": interface,
-                    "model": "keplr_wallet"
-                }
-                return
-            else:
-                logger.info(f"🔵 KEPLR LAYER STREAM: Cannot handle query, passing to MCP layer")
-        else:
-            logger.info(f"🔵 KEPLR LAYER STREAM: Wallet not connected, skipping to MCP layer")
-        
-        # LAYER 2: Check MCP/Secret Network queries
-        logger.info(f"🟠 MCP LAYER STREAM: Checking for Secret Network queries...")
-        forced_tool_calls = self._detect_secret_network_queries(message, wallet_address)
-        logger.info(f"🟠 MCP LAYER STREAM: Secret Network pre-detection found {len(forced_tool_calls)} tool calls")
-        if forced_tool_calls:
-            logger.info(f"🟠 MCP LAYER STREAM: Secret Network query detected! Executing tools: {[tc['name'] for tc in forced_tool_calls]}")
+        # LAYERS 1-2: Keplr wallet data, then MCP/Secret Network tools
+        opts = options or _EMPTY_OPTIONS
+        layer = await self._resolve_layers(message, message_lower, opts, options)
+        if layer.kind == "keplr":
+            # Stream the content progressively like other responses
+            content = layer.payload["content"]
             
-            # Execute tools and return response
-            try:
-                tool_results = await self._execute_tools(forced_tool_calls)
-                
-                # Format tool results for display
-                tool_summary = "\n\n".join([
-                    f"**{result['tool']}**: " + 
-                    (self._format_tool_result(result['result']) if result['success'] else f"Error - {result['error']}")
-                    for result in tool_results
-                ])
-                
-                # Create MCP-style response for consistency
+            # Send content in chunks to simulate streaming
+            # (stream id and metadata are the same for every chunk, build them once)
+            chunk_size = 50  # Characters per chunk
+            stream_id = f"keplr_{hash(content) % 10000}"
+            metadata = KEPLR_CHUNK_METADATA
+            for i in range(0, len(content), chunk_size):
+                chunk_text = content[i:i + chunk_size]
                 yield {
                     "success": True,
                     "chunk": {
-                        "type": "mcp_response",
-                        "data": f"🔗 **Secret Network Tool Results**\n\n{tool_summary}",
-                        "metadata": {"mcp_command": True, "tool_execution": True, "tools_used": [tc['name'] for tc in forced_tool_calls]}
+                        "type": "content",  # Use 'content' type for consistency
+                        "data": chunk_text,
+                        "metadata": metadata
                     },
                     "interface": interface,
-                    "model": "mcp_service"
+                    "model": "keplr_wallet",
+                    "stream_id": stream_id
                 }
-                return
                 
-            except Exception as e:
-                logger.error(f"🟠 MCP LAYER STREAM: Secret Network tool execution failed: {e}")
-                # Fall through to LLM layer
-                logger.info("🟠 MCP LAYER STREAM: Falling back to LLM layer")
-        else:
-            logger.info(f"🟠 MCP LAYER STREAM: No Secret Network queries detected, passing to LLM layer")
+                # Small delay to make streaming visible
+                await asyncio.sleep(0.05)
+            
+            # Send stream completion signal
+            yield {
+                "success": True,
+                "chunk": {
+                    "type": "stream_complete",
+                    "data": "",
+                    "metadata": {"completed": True}
+                },
+                "interface": interface,
+                "model": "keplr_wallet"
+            }
+            return
+        if layer.kind == "mcp":
+            tool_names, tool_summary = layer.payload
+            # Create MCP-style response for consistency
+            yield {
+                "success": True,
+                "chunk": {
+                    "type": "mcp_response",
+                    "data": f"🔗 **Secret Network Tool Results**\n\n{tool_summary}",
+                    "metadata": {"mcp_command": True, "tool_execution": True, "tools_used": tool_names}
+                },
+                "interface": interface,
+                "model": "mcp_service"
+            }
+            return
         
         # LAYER 3: Use LLM for general questions
-        logger.info(f"🟢 LLM LAYER STREAM: Handling general query with AI...")
+        logger.debug("🟢 LLM LAYER STREAM: Handling general query with AI...")
 
-        if (message.strip().startswith('/mcp') or 
-            message_clean.startswith('mcp ') or
-            message_clean in ['mcp test', 'mcp status', 'mcp tools', 'test mcp', 'mcp help']):
+        # Handle debug commands (bypass AI) - support multiple formats
+        normalized_cmd = _normalize_mcp_command(stripped)
+        if normalized_cmd is not None:
             # MCP commands should return non-streaming response
-            logger.info(f"DEBUG STREAM: MCP command detected! Converting to non-streaming response")
-            if not message.strip().startswith('/'):
-                normalized_cmd = f"/mcp {message_clean.replace('mcp ', '').replace('test mcp', 'test').strip()}"
-            else:
-                normalized_cmd = message.strip()
-            logger.info(f"DEBUG STREAM: Normalized command: '{normalized_cmd}'")
+            logger.debug("MCP command detected! Converting to non-streaming response")
+            logger.debug("Normalized command: '%s'", normalized_cmd)
             
             # Get the MCP command response
             mcp_response = await self._handle_mcp_debug_command(normalized_cmd, interface)
@@ -440,39 +780,25 @@ Respond with: USE_TOOL: tool_name with arguments {{...}}
             }
             return
         
-        logger.info(f"DEBUG STREAM: Not an MCP command, proceeding with normal streaming")
+        logger.debug("Not an MCP command, proceeding with normal streaming")
         
         # Get Secret AI service
-        secret_ai = self.get_component(ComponentType.SECRET_AI)
+        secret_ai = self._secret_ai
         if not secret_ai:
             logger.error("Secret AI service not registered")
-            yield {
-                "success": False,
-                "error": "Secret AI service not available",
-                "interface": interface,
-                "chunk": {
-                    "type": "stream_error",
-                    "data": "Secret AI service not available",
-                    "metadata": {"error": True}
-                }
-            }
+            yield {**SECRET_AI_UNAVAILABLE_CHUNK, "interface": interface}
             return
         
         try:
-            # Use default options if not provided
-            if options is None:
-                options = {}
-            
             # Format messages using Secret AI's helper method
-            system_prompt = options.get("system_prompt", "You are a helpful assistant.")
+            system_prompt = opts.get("system_prompt", "You are a helpful assistant.")
             messages = secret_ai.format_messages(system_prompt, message)
             
             # Stream through Secret AI service
+            # (only the interface is stamped per chunk; request options are
+            # fixed for the whole stream and no consumer reads them per token)
             async for chunk_response in secret_ai.stream_invoke(messages):
-                # Add interface metadata to each chunk
                 chunk_response["interface"] = interface
-                chunk_response["options"] = options
-                
                 yield chunk_response
                 
         except Exception as e:
@@ -488,6 +814,23 @@ Respond with: USE_TOOL: tool_name with arguments {{...}}
                 }
             }
 
+    async def _check_component(self, comp_type: ComponentType, component: Any) -> Tuple[str, str, Optional[Dict[str, int]]]:
+        """Return (component name, status string, MCP capabilities or None) for a registered component"""
+        if comp_type is ComponentType.MCP_SERVICE:
+            mcp_status = await component.get_status()
+            # Include MCP capabilities summary
+            capabilities = {
+                "servers": len(mcp_status.get("servers", {})),
+                "tools": mcp_status["capabilities"].get("tools", 0),
+                "resources": mcp_status["capabilities"].get("resources", 0)
+            }
+            return comp_type.label, "operational" if mcp_status["initialized"] else "not_initialized", capabilities
+        if comp_type is ComponentType.SECRET_AI and hasattr(component, 'chat_client'):
+            # For Secret AI, check if initialized
+            return comp_type.label, "operational" if component.chat_client else "not_initialized", None
+        # Basic check - component exists
+        return comp_type.label, "registered", None
+
     async def get_system_status(self) -> Dict[str, Any]:
         """
         Get overall system status
@@ -500,40 +843,33 @@ Respond with: USE_TOOL: tool_name with arguments {{...}}
             "components": {}
         }
         
-        # Check each registered component
-        for comp_type, component in self.components.items():
-            try:
-                # Basic check - component exists
-                status["components"][comp_type.value] = "registered"
-                
-                # For Secret AI, check if initialized
-                if comp_type == ComponentType.SECRET_AI and hasattr(component, 'chat_client'):
-                    if component.chat_client:
-                        status["components"][comp_type.value] = "operational"
-                    else:
-                        status["components"][comp_type.value] = "not_initialized"
-                        
-            except Exception as e:
-                status["components"][comp_type.value] = f"error: {str(e)}"
+        # Probe every registered component (including the MCP status call)
+        # concurrently, so the overall latency is that of the slowest check
+        registered = list(self.components.items())
+        results = await asyncio.gather(
+            *(self._check_component(comp_type, component) for comp_type, component in registered),
+            return_exceptions=True
+        )
         
-        # Check MCP service status
-        mcp_service = self.get_component(ComponentType.MCP_SERVICE)
-        if mcp_service:
-            try:
-                mcp_status = await mcp_service.get_status()
-                status["components"]["mcp_service"] = "operational" if mcp_status["initialized"] else "not_initialized"
-                
-                # Include MCP capabilities summary
-                status["mcp_capabilities"] = {
-                    "servers": len(mcp_status.get("servers", {})),
-                    "tools": mcp_status["capabilities"].get("tools", 0),
-                    "resources": mcp_status["capabilities"].get("resources", 0)
-                }
-            except Exception as e:
-                status["components"]["mcp_service"] = f"error: {str(e)}"
+        for (comp_type, _), result in zip(registered, results):
+            if isinstance(result, BaseException):
+                status["components"][comp_type.label] = f"error: {str(result)}"
+                continue
+            name, comp_status, capabilities = result
+            status["components"][name] = comp_status
+            if capabilities is not None:
+                status["mcp_capabilities"] = capabilities
         
         return status
     
+    async def _get_available_tools(self, mcp_service: Any) -> List[Dict[str, Any]]:
+        """Return the MCP tool list, re-querying the service at most every TOOLS_CACHE_TTL seconds"""
+        now = time.monotonic()
+        if now >= self._tools_cache_expiry:
+            self._tools_cache = await mcp_service.get_available_tools()
+            self._tools_cache_expiry = now + TOOLS_CACHE_TTL
+        return self._tools_cache
+    
     async def initialize(self) -> None:
         """
         Initialize the hub router and all registered components
@@ -545,18 +881,19 @@ Respond with: USE_TOOL: tool_name with arguments {{...}}
         logger.info("Initializing hub router...")
         
         # Initialize Secret AI if registered
-        secret_ai = self.get_component(ComponentType.SECRET_AI)
+        secret_ai = self._secret_ai
         if secret_ai:
             logger.info("Secret AI service found and ready")
         
         # Initialize MCP Service if registered
-        mcp_service = self.get_component(ComponentType.MCP_SERVICE)
+        mcp_service = self._mcp_service
         if mcp_service:
             try:
                 await mcp_service.initialize()
                 
                 # Discover and log available capabilities
-                tools = await mcp_service.get_available_tools()
+                self._tools_cache_expiry = 0.0
+                tools = await self._get_available_tools(mcp_service)
                 resources = await mcp_service.get_available_resources()
                 logger.info(f"MCP service ready: {len(tools)} tools, {len(resources)} resources")
             except Exception as e:
@@ -574,8 +911,18 @@ Respond with: USE_TOOL: tool_name with arguments {{...}}
         # Add any cleanup logic here
         
         self.initialized = False
+        self._tools_cache = []
+        self._tools_cache_expiry = 0.0
+        self._balance_cache.clear()
+        self._network_status_cache = None
+        if self._http_session is not None:
+            try:
+                await self._http_session.close()
+            except Exception as e:
+                logger.error(f"Error closing HTTP session: {e}")
+            self._http_session = None
         # Shutdown MCP service if registered
-        mcp_service = self.get_component(ComponentType.MCP_SERVICE)
+        mcp_service = self._mcp_service
         if mcp_service:
             try:
                 await mcp_service.shutdown()
@@ -598,33 +945,50 @@ Respond with: USE_TOOL: tool_name with arguments {{...}}
         logger.info(f"Processing MCP debug command: {command}")
         
         try:
-            parts = command.split()
+            # At most ['/mcp', sub_command, rest]; the rest is only read by exec
+            parts = command.split(None, 2)
             if len(parts) < 2:
                 return {
                     "success": True,
-                    "content": "Available MCP debug commands:\n" +
-                              "• /mcp status - Check MCP service status\n" +
-                              "• /mcp test - Test Secret Network connection\n" +
-                              "• /mcp tools - List available tools\n" +
-                              "• /mcp exec <tool_name> - Execute specific tool",
+                    "content": MCP_DEBUG_HELP_TEXT,
                     "interface": interface,
                     "debug_command": True
                 }
             
             sub_command = parts[1].lower()
-            mcp_service = self.get_component(ComponentType.MCP_SERVICE)
-            
-            if sub_command == "status":
-                if not mcp_service:
-                    return {
-                        "success": False,
-                        "content": "❌ MCP service not available - service not registered",
-                        "interface": interface,
-                        "debug_command": True
-                    }
+            handler = self._MCP_DEBUG_COMMANDS.get(sub_command)
+            if handler is None:
+                return {
+                    "success": False,
+                    "content": f"❌ Unknown MCP command: {sub_command}\n\nUse '/mcp' to see available commands",
+                    "interface": interface,
+                    "debug_command": True
+                }
+            return await handler(self, parts, interface, self._mcp_service)
                 
-                status = await mcp_service.get_status()
-                status_text = f"""🔧 **MCP Service Status**
+        except Exception as e:
+            logger.error(f"Error handling MCP debug command: {e}")
+            return {
+                "success": False,
+                "content": f"❌ **MCP Debug Command Error**\n\n{str(e)}",
+                "interface": interface,
+                "debug_command": True,
+                "error": str(e)
+            }
+    
+    async def _mcp_debug_status(self, parts: List[str], interface: str, mcp_service: Any) -> Dict[str, Any]:
+        """/mcp status - report MCP service and server status"""
+        if not mcp_service:
+            return {
+                "success": False,
+                "content": "❌ MCP service not available - service not registered",
+                "interface": interface,
+                "debug_command": True
+            }
+        
+        status = await mcp_service.get_status()
+        server_details = "\n".join(f"• {srv}: {stat}" for srv, stat in status.get('servers', {}).items())
+        status_text = f"""🔧 **MCP Service Status**
                 
 **Service**: {'✅ Operational' if status['initialized'] else '❌ Not initialized'}
 **Servers**: {len(status.get('servers', {}))} connected
@@ -633,53 +997,45 @@ Respond with: USE_TOOL: tool_name with arguments {{...}}
 **Operations Logged**: {status.get('operations_logged', 0)}
 
 **Server Details**:
-{chr(10).join([f"• {srv}: {stat}" for srv, stat in status.get('servers', {}).items()])}"""
-                
-                return {
-                    "success": True,
-                    "content": status_text,
-                    "interface": interface,
-                    "debug_command": True,
-                    "mcp_status": status
-                }
-            
-            elif sub_command == "tools":
-                if not mcp_service or not mcp_service.initialized:
-                    return {
-                        "success": False,
-                        "content": "❌ MCP service not available or not initialized",
-                        "interface": interface,
-                        "debug_command": True
-                    }
-                
-                tools = await mcp_service.get_available_tools()
-                tools_text = f"🛠️ **Available MCP Tools** ({len(tools)} total):\n\n"
-                for tool in tools:
-                    tools_text += f"• **{tool['name']}**: {tool['description']}\n"
-                    if 'server_id' in tool:
-                        tools_text += f"  ↳ Server: {tool['server_id']}\n"
-                
-                return {
-                    "success": True,
-                    "content": tools_text,
-                    "interface": interface,
-                    "debug_command": True,
-                    "available_tools": tools
-                }
+{server_details}"""
             
-            elif sub_command == "test":
-                if not mcp_service or not mcp_service.initialized:
-                    return {
-                        "success": False,
-                        "content": "❌ MCP service not available or not initialized",
-                        "interface": interface,
-                        "debug_command": True
-                    }
-                
-                logger.info("Executing MCP test - secret_network_status tool")
-                try:
-                    result = await mcp_service.execute_tool("secret_network_status", {})
-                    test_text = f"""🧪 **MCP Test Results**
+        return {
+            "success": True,
+            "content": status_text,
+            "interface": interface,
+            "debug_command": True,
+            "mcp_status": status
+        }
+    
+    async def _mcp_debug_tools(self, parts: List[str], interface: str, mcp_service: Any) -> Dict[str, Any]:
+        """/mcp tools - list the available MCP tools"""
+        if not mcp_service or not mcp_service.initialized:
+            return {**MCP_DEBUG_NOT_AVAILABLE_RESPONSE, "interface": interface}
+        
+        tools = await mcp_service.get_available_tools()
+        tools_text = f"🛠️ **Available MCP Tools** ({len(tools)} total):\n\n"
+        for tool in tools:
+            tools_text += f"• **{tool['name']}**: {tool['description']}\n"
+            if 'server_id' in tool:
+                tools_text += f"  ↳ Server: {tool['server_id']}\n"
+        
+        return {
+            "success": True,
+            "content": tools_text,
+            "interface": interface,
+            "debug_command": True,
+            "available_tools": tools
+        }
+    
+    async def _mcp_debug_test(self, parts: List[str], interface: str, mcp_service: Any) -> Dict[str, Any]:
+        """/mcp test - run secret_network_status as a connectivity check"""
+        if not mcp_service or not mcp_service.initialized:
+            return {**MCP_DEBUG_NOT_AVAILABLE_RESPONSE, "interface": interface}
+        
+        logger.info("Executing MCP test - secret_network_status tool")
+        try:
+            result = await mcp_service.execute_tool("secret_network_status", {})
+            test_text = f"""🧪 **MCP Test Results**
                     
 **Tool**: secret_network_status
 **Status**: ✅ Success
@@ -687,44 +1043,40 @@ Respond with: USE_TOOL: tool_name with arguments {{...}}
 ```
 {result}
 ```"""
-                    return {
-                        "success": True,
-                        "content": test_text,
-                        "interface": interface,
-                        "debug_command": True,
-                        "tool_result": result
-                    }
-                except Exception as e:
-                    return {
-                        "success": False,
-                        "content": f"❌ **MCP Test Failed**\n\nError executing secret_network_status: {str(e)}",
-                        "interface": interface,
-                        "debug_command": True,
-                        "error": str(e)
-                    }
-            
-            elif sub_command == "exec":
-                if len(parts) < 3:
-                    return {
-                        "success": False,
-                        "content": "❌ Usage: /mcp exec <tool_name>\nExample: /mcp exec secret_network_status",
-                        "interface": interface,
-                        "debug_command": True
-                    }
-                
-                if not mcp_service or not mcp_service.initialized:
-                    return {
-                        "success": False,
-                        "content": "❌ MCP service not available or not initialized",
-                        "interface": interface,
-                        "debug_command": True
-                    }
-                
-                tool_name = parts[2]
-                logger.info(f"Executing MCP tool directly: {tool_name}")
-                try:
-                    result = await mcp_service.execute_tool(tool_name, {})
-                    exec_text = f"""⚡ **Direct Tool Execution**
+            return {
+                "success": True,
+                "content": test_text,
+                "interface": interface,
+                "debug_command": True,
+                "tool_result": result
+            }
+        except Exception as e:
+            return {
+                "success": False,
+                "content": f"❌ **MCP Test Failed**\n\nError executing secret_network_status: {str(e)}",
+                "interface": interface,
+                "debug_command": True,
+                "error": str(e)
+            }
+    
+    async def _mcp_debug_exec(self, parts: List[str], interface: str, mcp_service: Any) -> Dict[str, Any]:
+        """/mcp exec <tool_name> - execute a tool with no arguments"""
+        if len(parts) < 3:
+            return {
+                "success": False,
+                "content": "❌ Usage: /mcp exec <tool_name>\nExample: /mcp exec secret_network_status",
+                "interface": interface,
+                "debug_command": True
+            }
+        
+        if not mcp_service or not mcp_service.initialized:
+            return {**MCP_DEBUG_NOT_AVAILABLE_RESPONSE, "interface": interface}
+        
+        tool_name = parts[2].split(None, 1)[0]
+        logger.info(f"Executing MCP tool directly: {tool_name}")
+        try:
+            result = await mcp_service.execute_tool(tool_name, {})
+            exec_text = f"""⚡ **Direct Tool Execution**
                     
 **Tool**: {tool_name}
 **Status**: ✅ Success
@@ -732,47 +1084,38 @@ Respond with: USE_TOOL: tool_name with arguments {{...}}
 ```
 {result}
 ```"""
-                    return {
-                        "success": True,
-                        "content": exec_text,
-                        "interface": interface,
-                        "debug_command": True,
-                        "tool_result": result
-                    }
-                except Exception as e:
-                    return {
-                        "success": False,
-                        "content": f"❌ **Tool Execution Failed**\n\nError executing {tool_name}: {str(e)}",
-                        "interface": interface,
-                        "debug_command": True,
-                        "error": str(e)
-                    }
-            
-            else:
-                return {
-                    "success": False,
-                    "content": f"❌ Unknown MCP command: {sub_command}\n\nUse '/mcp' to see available commands",
-                    "interface": interface,
-                    "debug_command": True
-                }
-                
+            return {
+                "success": True,
+                "content": exec_text,
+                "interface": interface,
+                "debug_command": True,
+                "tool_result": result
+            }
         except Exception as e:
-            logger.error(f"Error handling MCP debug command: {e}")
             return {
                 "success": False,
-                "content": f"❌ **MCP Debug Command Error**\n\n{str(e)}",
+                "content": f"❌ **Tool Execution Failed**\n\nError executing {tool_name}: {str(e)}",
                 "interface": interface,
                 "debug_command": True,
                 "error": str(e)
             }
     
-    async def _check_keplr_data(self, message: str, wallet_connected: bool = False, wallet_address: str = None, options: Dict[str, Any] = None) -> Dict[str, Any]:
+    # /mcp <sub_command> dispatch table (unbound methods, called with self)
+    _MCP_DEBUG_COMMANDS = {
+        "status": _mcp_debug_status,
+        "tools": _mcp_debug_tools,
+        "test": _mcp_debug_test,
+        "exec": _mcp_debug_exec,
+    }
+    
+    async def _check_keplr_data(self, message: str, message_lower: str, wallet_connected: bool = False, wallet_address: str = None, options: Dict[str, Any] = None) -> Dict[str, Any]:
         """
         Check if query can be answered directly from connected Keplr wallet data
         This is the FIRST layer in the Keplr → MCP → LLM chain
         
         Args:
             message: The user's message
+            message_lower: The user's message, lowercased
             wallet_connected: Whether Keplr wallet is connected
             wallet_address: The connected wallet address
             
@@ -782,13 +1125,9 @@ Respond with: USE_TOOL: tool_name with arguments {{...}}
         if not wallet_connected or not wallet_address:
             return None
             
-        message_lower = message.lower()
         logger.info(f"🔵 KEPLR: Checking message: '{message}' (lower: '{message_lower}')")
 
         try:
-            # Import regex for more flexible matching
-            import re
-
             # FIRST: Check if this is a SNIP token query (sSCRT, SHD, etc.)
             # This must come before general balance checks
             snip_service = self.get_component(ComponentType.SNIP_TOKEN_SERVICE)
@@ -966,38 +1305,25 @@ Respond with: USE_TOOL: tool_name with arguments {{...}}
             # NATIVE SCRT BALANCE QUERIES (Direct LCD)
             # Check for native SCRT balance queries using direct blockchain query
             # This comes after SNIP tokens but before the MCP-based fallback
-            # Patterns for native SCRT balance queries
-            native_scrt_patterns = [
-                r'how\s+m(?:uch|any|ch)\s+scrt(?!\w)',  # "how much scrt" but not "sscrt"
-                r'how\s+m(?:uch|any)\s+(?:do\s+)?i\s+have',
-                r'(?:what|whats|what\'s)\s+(?:is\s+)?my\s+scrt\s+balance',
-                r'(?:show|check|get)\s+my\s+scrt\s+balance',
-                r'my\s+scrt\s+balance',
-                r'my\s+scrt(?!\w)',  # "my scrt" but not "my sscrt"
-                r'balance\s+(?:of\s+)?(?:my|mine)',
-                r'(?<!s)scrt\s+balance',  # "scrt balance" but not "sscrt balance"
-            ]
+            # Every native phrasing mentions one of the hint words, so most
+            # messages are rejected here without running the pattern passes
+            if not NATIVE_BALANCE_HINT_KEYWORDS.search(message_lower):
+                return None
 
             # Check if query matches native SCRT patterns
             native_scrt_matched = False
-            for pattern in native_scrt_patterns:
-                if re.search(pattern, message_lower, re.IGNORECASE):
+            for pattern in NATIVE_SCRT_PATTERNS:
+                if pattern.search(message_lower):
                     native_scrt_matched = True
-                    logger.info(f"🔵 KEPLR LAYER: Native SCRT balance pattern matched: '{pattern}'")
+                    logger.info(f"🔵 KEPLR LAYER: Native SCRT balance pattern matched: '{pattern.pattern}'")
                     break
 
             # Also match simple keywords if not a SNIP token query
-            if not native_scrt_matched:
-                simple_balance_keywords = ['my balance', 'my wallet', 'check balance', 'show balance']
-                snip_tokens = ['sscrt', 'stkd', 'shd', 'sienna', 'alter', 'button']
-                contains_snip_token = any(token in message_lower for token in snip_tokens)
-
-                if not contains_snip_token:
-                    for keyword in simple_balance_keywords:
-                        if keyword in message_lower:
-                            native_scrt_matched = True
-                            logger.info(f"🔵 KEPLR LAYER: Native SCRT balance keyword matched: '{keyword}'")
-                            break
+            if not native_scrt_matched and not SNIP_TOKEN_KEYWORDS.search(message_lower):
+                keyword_match = SIMPLE_BALANCE_KEYWORDS.search(message_lower)
+                if keyword_match:
+                    native_scrt_matched = True
+                    logger.info(f"🔵 KEPLR LAYER: Native SCRT balance keyword matched: '{keyword_match.group()}'")
 
             if native_scrt_matched:
                 logger.info(f"🔵 KEPLR LAYER: Querying native SCRT balance directly from blockchain...")
@@ -1078,169 +1404,157 @@ Respond with: USE_TOOL: tool_name with arguments {{...}}
 
         return None
     
-    def _detect_secret_network_queries(self, message: str, wallet_address: str = None) -> List[Dict[str, Any]]:
+    def _detect_secret_network_queries(self, message: str, message_lower: str, wallet_address: str = None) -> List[Dict[str, Any]]:
         """
         Aggressively detect Secret Network queries from user message before AI processing
         This helps with AI models like DeepSeek R1 that might not follow tool instructions
         
         Args:
             message: The user's original message
+            message_lower: The user's message, lowercased
             wallet_address: The connected wallet address (if any)
             
         Returns:
             List of tool calls that should be executed
         """
-        tool_calls = []
-        message_lower = message.lower()
+        if len(message) > DETECTION_SCAN_LIMIT:
+            message = message[:DETECTION_SCAN_LIMIT]
+            message_lower = message_lower[:DETECTION_SCAN_LIMIT]
         
         try:
-            # Check for send/transfer transactions FIRST (highest priority)
-            if any(keyword in message_lower for keyword in ['send', 'transfer', 'pay']):
-                # Look for patterns like "send X scrt to address"
-                secret_addr_pattern = r'secret1[a-z0-9]{38}'
-                addr_matches = re.findall(secret_addr_pattern, message)
-                
-                # Extract amount - improved pattern for decimals starting with dot
-                amount_pattern = r'(\d*\.?\d+)\s*(?:scrt|SCRT)'
-                amount_match = re.search(amount_pattern, message, re.IGNORECASE)
-                
-                if addr_matches and amount_match:
-                    # Found both address and amount - this is a send transaction
-                    to_address = addr_matches[0]  # Use first address found as recipient
-                    amount = amount_match.group(1)
-                    
-                    # Get wallet address from parameter
-                    if wallet_address:
-                        tool_calls.append({
-                            "name": "secret_send_tokens",
-                            "arguments": {
-                                "from_address": wallet_address,
-                                "to_address": to_address,
-                                "amount": amount
-                            }
-                        })
-                        logger.info(f"Pre-detected: Send transaction - {amount} SCRT from {wallet_address} to {to_address}")
-                        return tool_calls  # Return immediately for transaction requests
+            detected = self._scan_secret_network_queries(message, message_lower, wallet_address)
+        except Exception as e:
+            logger.error(f"Error in pre-detection of Secret Network queries: {e}")
+            detected = ()
+        
+        # Logged here rather than in the scan so repeated prompts that hit the
+        # memoized result are logged too; fresh dicts since the result is shared
+        tool_calls = []
+        for tool_call in detected:
+            logger.info(f"Pre-detected: {_describe_detected_tool_call(tool_call)}")
+            tool_calls.append({"name": tool_call["name"], "arguments": dict(tool_call["arguments"])})
+        
+        logger.info(f"Pre-detection found {len(tool_calls)} tool calls")
+        return tool_calls
+    
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _scan_secret_network_queries(message: str, message_lower: str, wallet_address: Optional[str]) -> Tuple[Dict[str, Any], ...]:
+        """
+        Keyword and pattern scan behind _detect_secret_network_queries
+        
+        The result depends only on the arguments and the scan has no side
+        effects (no logging), so it is memoized for retried and repeated
+        prompts. Callers must not mutate the returned tool calls.
+        """
+        tool_calls = []
+        
+        # Check for send/transfer transactions FIRST (highest priority)
+        if SEND_KEYWORDS.search(message_lower):
+            # Look for patterns like "send X scrt to address"
+            addr_match = SECRET_ADDRESS_PATTERN.search(message)
             
-            # Personal balance queries are now handled by Keplr layer, so skip them here
-            # Balance queries with address detection (check FIRST since personal queries are handled above)
-            if 'balance' in message_lower and any(term in message for term in ['secret1', 'SCRT', 'scrt']):
-                secret_addr_pattern = r'secret1[a-z0-9]{38}'  # More specific pattern
-                addr_matches = re.findall(secret_addr_pattern, message)
-                if addr_matches:
-                    for addr in addr_matches:
-                        tool_calls.append({
-                            "name": "secret_query_balance",
-                            "arguments": {"address": addr}
-                        })
-                        logger.info(f"Pre-detected: Balance query for address {addr}")
-                        break  # Only do first address to avoid spam
+            # Extract amount - improved pattern for decimals starting with dot
+            amount_match = SCRT_AMOUNT_PATTERN.search(message)
             
-            # Block queries
-            elif any(keyword in message_lower for keyword in [
-                'latest block', 'current block', 'recent block', 'block info',
-                'block information', 'block details', 'last block', 'newest block',
-                'block height', 'current height', 'latest height', 'what is the block height',
-                'get block height', 'show block height', 'block number'
-            ]):
+            if addr_match and amount_match:
+                # Found both address and amount - this is a send transaction
+                to_address = addr_match.group(0)  # Use first address found as recipient
+                amount = amount_match.group(1)
+                
+                # Get wallet address from parameter
+                if wallet_address:
+                    tool_calls.append({
+                        "name": "secret_send_tokens",
+                        "arguments": {
+                            "from_address": wallet_address,
+                            "to_address": to_address,
+                            "amount": amount
+                        }
+                    })
+                    return tuple(tool_calls)  # Return immediately for transaction requests
+        
+        # Personal balance queries are now handled by Keplr layer, so skip them here
+        # Balance queries with address detection (check FIRST since personal queries are handled above)
+        if 'balance' in message_lower and SCRT_MENTION_KEYWORDS.search(message):
+            # Only the first address, to avoid spam
+            addr_match = SECRET_ADDRESS_PATTERN.search(message)
+            if addr_match:
+                addr = addr_match.group(0)
                 tool_calls.append({
-                    "name": "secret_query_block",
+                    "name": "secret_query_balance",
+                    "arguments": {"address": addr}
+                })
+        
+        # Block queries
+        elif BLOCK_INFO_KEYWORDS.search(message_lower):
+            tool_calls.append({
+                "name": "secret_query_block",
+                "arguments": {}
+            })
+        
+        # Specific block number queries
+        elif block_number_match := BLOCK_NUMBER_PATTERN.search(message_lower):
+            block_height = int(block_number_match.group(1) or block_number_match.group(2) or block_number_match.group(3))
+            tool_calls.append({
+                "name": "secret_query_block",
+                "arguments": {"height": block_height}
+            })
+        
+        # Network status and chain info queries (move to LAST to avoid catching balance queries)
+        elif NETWORK_KEYWORDS.search(message_lower):
+            # Check for status/info requests, excluding balance and transaction queries
+            if STATUS_KEYWORDS.search(message_lower) and not BALANCE_OR_TX_KEYWORDS.search(message_lower):
+                tool_calls.append({
+                    "name": "secret_network_status",
                     "arguments": {}
                 })
-                logger.info("Pre-detected: Block information query")
-            
-            # Specific block number queries
-            elif re.search(r'block\s+(\d+)|block\s+#(\d+)|block\s+height\s+(\d+)', message_lower):
-                block_number_match = re.search(r'block\s+(\d+)|block\s+#(\d+)|block\s+height\s+(\d+)', message_lower)
-                block_height = int(block_number_match.group(1) or block_number_match.group(2) or block_number_match.group(3))
+            # Also handle generic network/chain queries without explicit status keywords
+            # (at most 4 words; the bounded split stops after the 5th)
+            elif 'secret network' in message_lower and len(message_lower.split(None, 4)) <= 4:
                 tool_calls.append({
-                    "name": "secret_query_block",
-                    "arguments": {"height": block_height}
+                    "name": "secret_network_status",
+                    "arguments": {}
                 })
-                logger.info(f"Pre-detected: Specific block query for height {block_height}")
-            
-            # Network status and chain info queries (move to LAST to avoid catching balance queries)
-            elif any(keyword in message_lower for keyword in [
-                'secret network', 'scrt network', 'chain info', 'network status', 
-                'chain information', 'network info', 'secret chain', 'scrt chain',
-                'chain status', 'blockchain info', 'blockchain status'
-            ]):
-                # Check for status/info requests, excluding balance and transaction queries
-                if any(term in message_lower for term in [
-                    'status', 'info', 'information', 'details'
-                ]) and not any(term in message_lower for term in ['balance', 'transaction']):
-                    tool_calls.append({
-                        "name": "secret_network_status",
-                        "arguments": {}
-                    })
-                    logger.info("Pre-detected: Secret Network status query")
-                # Also handle generic network/chain queries without explicit status keywords
-                elif 'secret network' in message_lower and len(message_lower.split()) <= 4:
-                    tool_calls.append({
-                        "name": "secret_network_status",
-                        "arguments": {}
-                    })
-                    logger.info("Pre-detected: Generic Secret Network query")
-            
-            # Transaction queries
-            tx_hash_pattern = r'[a-fA-F0-9]{64}'  # 64-character hex string
-            if any(keyword in message_lower for keyword in ['transaction', 'tx', 'txhash', 'hash']):
-                tx_matches = re.findall(tx_hash_pattern, message)
-                if tx_matches:
-                    tool_calls.append({
-                        "name": "secret_query_transaction",
-                        "arguments": {"txHash": tx_matches[0]}
-                    })
-                    logger.info(f"Pre-detected: Transaction query for hash {tx_matches[0][:16]}...")
-            
-            # Account/address queries (not balance)
-            if any(keyword in message_lower for keyword in [
-                'account info', 'address info', 'account details', 'address details',
-                'account number', 'sequence number'
-            ]):
-                secret_addr_pattern = r'secret1[a-z0-9]{38}'
-                addr_matches = re.findall(secret_addr_pattern, message)
-                if addr_matches:
-                    tool_calls.append({
-                        "name": "secret_query_account",
-                        "arguments": {"address": addr_matches[0]}
-                    })
-                    logger.info(f"Pre-detected: Account query for address {addr_matches[0]}")
-            
-            # Simple test phrases that always trigger MCP (for testing)
-            if not tool_calls:
-                test_phrases = [
-                    'test secret network', 'test mcp connection', 'secret network test',
-                    'check secret network', 'ping secret network', 'secret network status',
-                    'is secret network working', 'secret network info'
-                ]
-                if any(phrase in message_lower for phrase in test_phrases):
-                    tool_calls.append({
-                        "name": "secret_network_status",
-                        "arguments": {}
-                    })
-                    logger.info("Pre-detected: Test phrase triggered Secret Network status")
-            
-            # Generic Secret Network mentions (fallback) - but exclude balance/personal queries
-            if not tool_calls and any(keyword in message_lower for keyword in [
-                'secret network', 'secret blockchain'
-            ]) and any(question in message_lower for question in [
-                'what', 'how', 'show', 'get', 'tell', 'info', 'status', 'current'
-            ]) and not any(personal in message_lower for personal in [
-                'my', 'balance', 'wallet', 'account', 'i have', 'scrt'
-            ]):
-                # Default to network status for generic queries (excluding personal/balance queries)
+        
+        # Transaction queries
+        if TX_KEYWORDS.search(message_lower):
+            tx_match = TX_HASH_PATTERN.search(message)
+            if tx_match:
+                tx_hash = tx_match.group(0)
+                tool_calls.append({
+                    "name": "secret_query_transaction",
+                    "arguments": {"txHash": tx_hash}
+                })
+        
+        # Account/address queries (not balance)
+        if ACCOUNT_KEYWORDS.search(message_lower):
+            addr_match = SECRET_ADDRESS_PATTERN.search(message)
+            if addr_match:
+                tool_calls.append({
+                    "name": "secret_query_account",
+                    "arguments": {"address": addr_match.group(0)}
+                })
+        
+        # Simple test phrases that always trigger MCP (for testing)
+        if not tool_calls:
+            if TEST_PHRASE_KEYWORDS.search(message_lower):
                 tool_calls.append({
-                    "name": "secret_network_status", 
+                    "name": "secret_network_status",
                     "arguments": {}
                 })
-                logger.info("Pre-detected: Generic Secret Network query, defaulting to status")
-                
-        except Exception as e:
-            logger.error(f"Error in pre-detection of Secret Network queries: {e}")
         
-        logger.info(f"Pre-detection found {len(tool_calls)} tool calls")
-        return tool_calls
+        # Generic Secret Network mentions (fallback) - but exclude balance/personal queries
+        if (not tool_calls and GENERIC_NETWORK_KEYWORDS.search(message_lower)
+                and QUESTION_KEYWORDS.search(message_lower)
+                and not PERSONAL_KEYWORDS.search(message_lower)):
+            # Default to network status for generic queries (excluding personal/balance queries)
+            tool_calls.append({
+                "name": "secret_network_status", 
+                "arguments": {}
+            })
+        
+        return tuple(tool_calls)
     
     def _extract_tool_calls(self, response: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
@@ -1259,12 +1573,14 @@ Respond with: USE_TOOL: tool_name with arguments {{...}}
             content = response.get("content", "")
             logger.info(f"Analyzing response for tool calls: {content[:200]}...")
             
-            import json
-            import re
-            
-            # Look for USE_TOOL: pattern
-            use_tool_pattern = r'USE_TOOL:\s*(\w+)\s+with\s+arguments\s*(\{[^}]*\})'
-            matches = re.findall(use_tool_pattern, content, re.IGNORECASE)
+            # Collect USE_TOOL: calls and legacy JSON calls in one scan
+            matches = []
+            json_matches = []
+            for match in TOOL_CALL_PATTERN.finditer(content):
+                if match.group("use_tool"):
+                    matches.append((match.group("tool"), match.group("args")))
+                else:
+                    json_matches.append(match.group("json"))
             
             for tool_name, args_str in matches:
                 try:
@@ -1284,9 +1600,6 @@ Respond with: USE_TOOL: tool_name with arguments {{...}}
             
             # Fallback: Look for old JSON format for backwards compatibility
             if not tool_calls:
-                json_pattern = r'\{[^{}]*"tool_name"[^{}]*"arguments"[^{}]*\}'
-                json_matches = re.findall(json_pattern, content, re.IGNORECASE)
-                
                 for match in json_matches:
                     try:
                         tool_call = json.loads(match)
@@ -1304,7 +1617,7 @@ Respond with: USE_TOOL: tool_name with arguments {{...}}
                 content_lower = content.lower()
                 
                 # Network status queries
-                if any(keyword in content_lower for keyword in ['chain info', 'network status', 'chain information', 'network info']):
+                if RESPONSE_NETWORK_KEYWORDS.search(content_lower):
                     tool_calls.append({
                         "name": "secret_network_status",
                         "arguments": {}
@@ -1312,7 +1625,7 @@ Respond with: USE_TOOL: tool_name with arguments {{...}}
                     logger.info("Detected network status query via keywords")
                 
                 # Block queries
-                elif any(keyword in content_lower for keyword in ['latest block', 'current block', 'block info']):
+                elif RESPONSE_BLOCK_KEYWORDS.search(content_lower):
                     tool_calls.append({
                         "name": "secret_query_block", 
                         "arguments": {}
@@ -1321,8 +1634,7 @@ Respond with: USE_TOOL: tool_name with arguments {{...}}
                 
                 # Balance queries (look for secret1 addresses)
                 elif 'balance' in content_lower and 'secret1' in content:
-                    secret_addr_pattern = r'secret1[a-z0-9]+'
-                    addr_matches = re.findall(secret_addr_pattern, content)
+                    addr_matches = LOOSE_SECRET_ADDRESS_PATTERN.findall(content)
                     if addr_matches:
                         tool_calls.append({
                             "name": "secret_query_balance",
@@ -1337,96 +1649,87 @@ Respond with: USE_TOOL: tool_name with arguments {{...}}
         
         return tool_calls
     
+    async def _execute_tool(self, mcp_service: Any, tool_call: Dict[str, Any], position: str) -> Dict[str, Any]:
+        """Execute a single MCP tool call and wrap the outcome as a result dict"""
+        tool_name = tool_call["name"]
+        args = tool_call["arguments"]
+        
+        logger.info(f"🚀 Executing tool {position}: {tool_name}")
+        logger.info(f"📋 Arguments: {args}")
+        
+        try:
+            # Execute tool via MCP service
+            logger.info(f"⏳ Calling Secret Network via MCP server...")
+            result = await mcp_service.execute_tool(tool_name, args)
+            
+            logger.info(f"✅ Tool {tool_name} executed successfully")
+            if logger.isEnabledFor(logging.INFO):
+                result_text = str(result)
+                logger.info(f"📊 Result preview: {result_text[:100]}{'...' if len(result_text) > 100 else ''}")
+            
+            # Format result for AI consumption
+            return {
+                "tool": tool_name,
+                "success": True,
+                "result": result
+            }
+            
+        except Exception as e:
+            logger.error(f"❌ Tool {tool_name} execution failed: {str(e)}")
+            # Handle tool execution errors gracefully
+            return {
+                "tool": tool_name, 
+                "success": False,
+                "error": str(e)
+            }
+    
     async def _execute_tools(self, tool_calls: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Execute MCP tools and format results for AI"""
         logger.info(f"🔧 EXECUTING MCP TOOLS: {len(tool_calls)} tools requested")
         
-        mcp_service = self.get_component(ComponentType.MCP_SERVICE)
+        mcp_service = self._mcp_service
         if not mcp_service:
             logger.error("❌ MCP service not available for tool execution")
             return []
-            
-        tool_results = []
         
-        for i, tool_call in enumerate(tool_calls, 1):
-            tool_name = tool_call["name"]
-            args = tool_call["arguments"]
-            
-            logger.info(f"🚀 Executing tool {i}/{len(tool_calls)}: {tool_name}")
-            logger.info(f"📋 Arguments: {args}")
-            
-            try:
-                # Execute tool via MCP service
-                logger.info(f"⏳ Calling Secret Network via MCP server...")
-                result = await mcp_service.execute_tool(tool_name, args)
-                
-                logger.info(f"✅ Tool {tool_name} executed successfully")
-                logger.info(f"📊 Result preview: {str(result)[:100]}{'...' if len(str(result)) > 100 else ''}")
-                
-                # Format result for AI consumption
-                tool_results.append({
-                    "tool": tool_name,
-                    "success": True,
-                    "result": result
-                })
-                
-            except Exception as e:
-                logger.error(f"❌ Tool {tool_name} execution failed: {str(e)}")
-                # Handle tool execution errors gracefully
-                tool_results.append({
-                    "tool": tool_name, 
-                    "success": False,
-                    "error": str(e)
-                })
+        # Fast path: a single tool call (the usual case) is awaited directly
+        if len(tool_calls) == 1:
+            return [await self._execute_tool(mcp_service, tool_calls[0], "1/1")]
+        
+        total = len(tool_calls)
+        if all(tc['name'] in _READ_ONLY_TOOLS for tc in tool_calls):
+            # Independent queries: overlap the MCP round trips (results keep call order)
+            tool_results = list(await asyncio.gather(*(
+                self._execute_tool(mcp_service, tool_call, f"{i}/{total}")
+                for i, tool_call in enumerate(tool_calls, 1)
+            )))
+        else:
+            # Anything with side effects (e.g. token transfers) runs in order
+            tool_results = []
+            for i, tool_call in enumerate(tool_calls, 1):
+                tool_results.append(
+                    await self._execute_tool(mcp_service, tool_call, f"{i}/{total}")
+                )
         
         logger.info(f"🎯 MCP execution complete: {sum(1 for r in tool_results if r['success'])}/{len(tool_results)} tools succeeded")
         return tool_results
     
-    def _is_general_ai_query(self, message: str) -> bool:
+    def _is_general_ai_query(self, message_lower: str) -> bool:
         """
         Check if message is a general AI query that should skip blockchain layers
         Returns True for general conversation, False for potential blockchain queries
+        Expects the message already lowercased and stripped of surrounding whitespace
         """
-        message_lower = message.strip().lower()
-
-        # General greetings and conversation starters
-        general_patterns = [
-            # Greetings
-            'hello', 'hi', 'hey', 'good morning', 'good afternoon', 'good evening',
-            'how are you', 'whats up', "what's up", 'how is it going',
-
-            # General questions
-            'what is', 'what are', 'how do', 'how does', 'explain', 'tell me about',
-            'can you', 'could you', 'would you', 'will you',
-
-            # Programming/general help (not blockchain specific)
-            'help me with', 'how to', 'write code', 'create a', 'build a',
-            'python', 'javascript', 'react', 'html', 'css',
-
-            # General knowledge
-            'who is', 'where is', 'when did', 'why does', 'what does',
-            'calculate', 'solve', 'find the', 'what time',
-        ]
-
-        # FIRST: Check for blockchain keywords (highest priority)
-        blockchain_keywords = [
-            'scrt', 'secret network', 'secret', 'balance', 'wallet', 'keplr',
-            'transaction', 'transfer', 'send', 'tokens', 'crypto', 'blockchain',
-            'contract', 'gas', 'fee', 'address', 'secret1', 'block', 'chain'
-        ]
-
-        # If message contains blockchain keywords, don't route to general AI
-        for keyword in blockchain_keywords:
-            if keyword in message_lower:
-                return False
+        # FIRST: If message contains blockchain keywords, don't route to general AI
+        if BLOCKCHAIN_KEYWORDS.search(message_lower):
+            return False
 
         # SECOND: Check if message starts with general patterns
-        for pattern in general_patterns:
-            if message_lower.startswith(pattern):
-                return True
+        if message_lower.startswith(GENERAL_QUERY_PREFIXES):
+            return True
 
         # If message is very short and not blockchain-related, it's probably general
-        if len(message.strip()) <= 20:
+        if len(message_lower) <= 20:
             return True
 
         # Default: route through blockchain layers for safety
@@ -1439,22 +1742,14 @@ Respond with: USE_TOOL: tool_name with arguments {{...}}
         logger.info(f"🟢 LLM LAYER DIRECT: Handling general query with AI...")
 
         # Get Secret AI service
-        secret_ai = self.get_component(ComponentType.SECRET_AI)
+        secret_ai = self._secret_ai
         if not secret_ai:
             logger.error("🟢 LLM LAYER DIRECT: Secret AI service not registered")
-            return {
-                "success": False,
-                "error": "Secret AI service not available",
-                "interface": interface
-            }
+            return {**SECRET_AI_UNAVAILABLE_RESPONSE, "interface": interface}
 
         try:
-            # Use default options if not provided
-            if options is None:
-                options = {}
-
             # Use simple system prompt for general queries
-            system_prompt = options.get("system_prompt", "You are a helpful AI assistant.")
+            system_prompt = (options or _EMPTY_OPTIONS).get("system_prompt", "You are a helpful AI assistant.")
 
             # Format messages using Secret AI's helper method
             messages = secret_ai.format_messages(system_prompt, message)
@@ -1464,7 +1759,7 @@ Respond with: USE_TOOL: tool_name with arguments {{...}}
 
             # Add interface metadata
             response["interface"] = interface
-            response["options"] = options
+            response["options"] = options or {}
             response["source"] = "llm_direct"
 
             return response
@@ -1484,35 +1779,22 @@ Respond with: USE_TOOL: tool_name with arguments {{...}}
         logger.info(f"🟢 LLM LAYER DIRECT STREAM: Handling general query with AI...")
 
         # Get Secret AI service
-        secret_ai = self.get_component(ComponentType.SECRET_AI)
+        secret_ai = self._secret_ai
         if not secret_ai:
             logger.error("Secret AI service not registered")
-            yield {
-                "success": False,
-                "error": "Secret AI service not available",
-                "interface": interface,
-                "chunk": {
-                    "type": "stream_error",
-                    "data": "Secret AI service not available",
-                    "metadata": {"error": True}
-                }
-            }
+            yield {**SECRET_AI_UNAVAILABLE_CHUNK, "interface": interface}
             return
 
         try:
-            # Use default options if not provided
-            if options is None:
-                options = {}
-
             # Use simple system prompt for general queries
-            system_prompt = options.get("system_prompt", "You are a helpful AI assistant.")
+            system_prompt = (options or _EMPTY_OPTIONS).get("system_prompt", "You are a helpful AI assistant.")
             messages = secret_ai.format_messages(system_prompt, message)
 
             # Stream through Secret AI service
             async for chunk_response in secret_ai.stream_invoke(messages):
-                # Add interface metadata to each chunk
+                # Add interface metadata to each chunk (options are not
+                # repeated per token, see stream_message)
                 chunk_response["interface"] = interface
-                chunk_response["options"] = options
                 chunk_response["source"] = "llm_direct_stream"
 
                 yield chunk_response
@@ -1536,7 +1818,7 @@ Respond with: USE_TOOL: tool_name with arguments {{...}}
             if isinstance(result, dict):
                 if 'content' in result and isinstance(result['content'], list):
                     # MCP standard format with content array
-                    return '\n'.join([item.get('text', str(item)) for item in result['content'] if 'text' in item])
+                    return '\n'.join([item['text'] for item in result['content'] if isinstance(item, dict) and 'text' in item])
                 elif 'content' in result:
                     return str(result['content'])
                 else:
@@ -1553,16 +1835,15 @@ Respond with: USE_TOOL: tool_name with arguments {{...}}
         """Send tool results back to AI for final response"""
         try:
             # Format tool results for AI
-            tool_summary = "\\n\\n".join([
-                f"Tool '{result['tool']}': " + 
-                (f"Success - {result['result']}" if result['success'] 
-                 else f"Error - {result['error']}")
+            tool_summary = "\n\n".join(
+                f"Tool '{result['tool']}': Success - {result['result']}" if result['success']
+                else f"Tool '{result['tool']}': Error - {result['error']}"
                 for result in tool_results
-            ])
+            )
             
             # Create enhanced prompt with tool results
             enhanced_message = (
-                f"Based on the tool execution results:\\n\\n{tool_summary}\\n\\n"
+                f"Based on the tool execution results:\n\n{tool_summary}\n\n"
                 f"Please provide a comprehensive response to the user's original question."
             )
             
@@ -1589,9 +1870,26 @@ Respond with: USE_TOOL: tool_name with arguments {{...}}
     
     # Wallet Proxy Methods (Bridge-Ready for Attestation)
     
+    async def _cached_network_status(self, mcp_service: Any) -> Optional[Dict[str, Any]]:
+        """
+        Probe secret_network_status for the wallet health checks
+        
+        A healthy result is reused for NETWORK_STATUS_CACHE_TTL seconds; an
+        error result or exception clears the cache so the next call re-probes.
+        """
+        cached = self._network_status_cache
+        if cached is not None and time.monotonic() - cached[0] < NETWORK_STATUS_CACHE_TTL:
+            return cached[1]
+        
+        self._network_status_cache = None
+        result = await mcp_service.call_tool("secret_network_status", {})
+        if result and "error" not in result:
+            self._network_status_cache = (time.monotonic(), result)
+        return result
+    
     async def connect_wallet(self, address: str, name: str = None, is_hardware: bool = False) -> Dict[str, Any]:
         """Connect wallet through MCP service directly"""
-        mcp_service = self.get_component(ComponentType.MCP_SERVICE)
+        mcp_service = self._mcp_service
         if not mcp_service:
             logger.error("MCP service not registered")
             return {
@@ -1602,7 +1900,7 @@ Respond with: USE_TOOL: tool_name with arguments {{...}}
         
         try:
             # Use MCP service to validate wallet address and store connection info
-            result = await mcp_service.call_tool("secret_network_status", {})
+            result = await self._cached_network_status(mcp_service)
             if result and "error" not in result:
                 # If MCP service is working, consider wallet "connected" 
                 # (actual connection is handled by frontend Keplr)
@@ -1629,39 +1927,54 @@ Respond with: USE_TOOL: tool_name with arguments {{...}}
                 "bridge_ready": True
             }
     
+    async def _get_http_session(self) -> Any:
+        """Return the shared HTTP session, creating it on first use"""
+        if self._http_session is None or self._http_session.closed:
+            import aiohttp
+            self._http_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=60)
+            )
+        return self._http_session
+    
     async def get_wallet_balance(self, address: str) -> Dict[str, Any]:
         """Get wallet balance through direct HTTP call to secret_network_mcp"""
-        import aiohttp
         import os
         
+        cached = self._balance_cache.get(address)
+        if cached is not None and time.monotonic() - cached[0] < BALANCE_CACHE_TTL:
+            logger.info(f"Returning cached balance for address: {address}")
+            return dict(cached[1])
+        
         # Check multiple possible env var names for MCP URL
         mcp_url = os.getenv("SECRET_NETWORK_MCP_URL") or os.getenv("SECRET_MCP_URL") or "http://host.docker.internal:8002"
         logger.info(f"Using MCP URL: {mcp_url}")
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"{mcp_url}/api/wallet/balance/{address}") as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        logger.info(f"Balance query successful for address: {address}")
-                        logger.info(f"Raw balance response: {data}")
-                        
-                        if data.get("success"):
-                            # Transform response to expected format
-                            balance_amount = data.get("balance", "0")
-                            return {
-                                "success": True,
-                                "balance": {
-                                    "amount": balance_amount,
-                                    "denom": data.get("denom", "uscrt")
-                                },
-                                "formatted": data.get("formatted", f"{float(balance_amount)/1000000:.6f} SCRT")
-                            }
-                        else:
-                            raise Exception(f"MCP service returned error: {data.get('error', 'Unknown error')}")
+            session = await self._get_http_session()
+            async with session.get(f"{mcp_url}/api/wallet/balance/{address}") as response:
+                if response.status == 200:
+                    data = await response.json()
+                    logger.info(f"Balance query successful for address: {address}")
+                    logger.info(f"Raw balance response: {data}")
+                    
+                    if data.get("success"):
+                        # Transform response to expected format
+                        balance_amount = data.get("balance", "0")
+                        result = {
+                            "success": True,
+                            "balance": {
+                                "amount": balance_amount,
+                                "denom": data.get("denom", "uscrt")
+                            },
+                            "formatted": data.get("formatted", f"{float(balance_amount)/1000000:.6f} SCRT")
+                        }
+                        self._cache_balance(address, result)
+                        return result
                     else:
-                        raise Exception(f"HTTP {response.status}: {await response.text()}")
-                        
+                        raise Exception(f"MCP service returned error: {data.get('error', 'Unknown error')}")
+                else:
+                    raise Exception(f"HTTP {response.status}: {await response.text()}")
+                    
         except Exception as e:
             logger.error(f"Balance query failed: {e}")
             # Return actual error instead of fallback data
@@ -1672,9 +1985,21 @@ Respond with: USE_TOOL: tool_name with arguments {{...}}
                 "formatted": "Error retrieving balance"
             }
     
+    def _cache_balance(self, address: str, result: Dict[str, Any]) -> None:
+        """Store a successful balance lookup, dropping expired entries when full"""
+        now = time.monotonic()
+        if len(self._balance_cache) >= BALANCE_CACHE_MAX_SIZE:
+            self._balance_cache = {
+                addr: entry for addr, entry in self._balance_cache.items()
+                if now - entry[0] < BALANCE_CACHE_TTL
+            }
+            if len(self._balance_cache) >= BALANCE_CACHE_MAX_SIZE:
+                self._balance_cache.clear()
+        self._balance_cache[address] = (now, dict(result))
+    
     async def get_transaction_status(self, tx_hash: str) -> Dict[str, Any]:
         """Get transaction status through MCP service directly"""
-        mcp_service = self.get_component(ComponentType.MCP_SERVICE)
+        mcp_service = self._mcp_service
         if not mcp_service:
             logger.error("MCP service not registered")
             return {
@@ -1723,7 +2048,7 @@ Respond with: USE_TOOL: tool_name with arguments {{...}}
     
     async def get_wallet_status(self) -> Dict[str, Any]:
         """Get wallet service status through MCP service directly"""
-        mcp_service = self.get_component(ComponentType.MCP_SERVICE)
+        mcp_service = self._mcp_service
         if not mcp_service:
             return {
                 "success": False,
@@ -1733,7 +2058,7 @@ Respond with: USE_TOOL: tool_name with arguments {{...}}
         
         try:
             # Test MCP service connectivity
-            result = await mcp_service.call_tool("secret_network_status", {})
+            result = await self._cached_network_status(mcp_service)
             if result and "error" not in result:
                 logger.info("Wallet status check - MCP service operational")
                 return {
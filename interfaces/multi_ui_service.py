@@ -4,11 +4,9 @@ Supports both AttestAI (attestai.io) and SecretGPTee (secretgptee.com) interface
 """
 import logging
 from typing import Dict, Any, Optional
-from urllib.parse import urlparse
 
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import RedirectResponse
 
 from hub.core.router import HubRouter, ComponentType
 from interfaces.web_ui.service import WebUIService
@@ -11,9 +11,9 @@ from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
-import json
 
 from hub.core.router import HubRouter, ComponentType
+from utils.serialization import json_dumps
 
 logger = logging.getLogger(__name__)
 
@@ -235,7 +235,7 @@ class SecretGPTeeInterface:
                                 event_data["error"] = chunk_response.get("error")
                             
                             # Send as SSE format
-                            sse_data = f"data: {json.dumps(event_data)}\n\n"
+                            sse_data = f"data: {json_dumps(event_data)}\n\n"
                             logger.info(f"SecretGPTee: Yielding SSE: {sse_data[:100]}...")
                             yield sse_data
                         
@@ -253,7 +253,7 @@ class SecretGPTeeInterface:
                                 "metadata": {"error": True}
                             }
                         }
-                        yield f"data: {json.dumps(error_event)}\n\n"
+                        yield f"data: {json_dumps(error_event)}\n\n"
                 
                 return StreamingResponse(
                     event_generator(),
@@ -3,7 +3,6 @@ SecretGPTee Service Integration with Hub Router
 Consumer-focused service with enhanced wallet and blockchain integration
 """
 import logging
-from pathlib import Path
 
 from hub.core.router import HubRouter, ComponentType
 from interfaces.secret_gptee.app import SecretGPTeeInterface
@@ -4,6 +4,8 @@ Migrated from attest_ai following DETAILED_BUILD_PLAN.md patterns
 REFERENCE: F:/coding/attest_ai/src/main.py (FastAPI app structure)
 """
 import logging
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional
 
@@ -15,10 +17,42 @@ from fastapi.middleware.cors import CORSMiddleware
 import json
 
 from hub.core.router import HubRouter, ComponentType
+from utils.serialization import json_dumps
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _docker_container_id() -> Optional[str]:
+    """
+    Get the short Docker container ID from /proc/self/cgroup
+    
+    The container a process runs in never changes, so the .dockerenv stat
+    and cgroup read happen once per process instead of once per request.
+    
+    Returns:
+        First 12 chars of the container ID, or None if not running in Docker
+    """
+    # Check if we're in a container by looking for .dockerenv
+    if not os.path.exists("/.dockerenv"):
+        return None
+    
+    try:
+        with open("/proc/self/cgroup", "r") as f:
+            cgroup_content = f.read()
+    except OSError:
+        # Can't read cgroup info
+        return None
+    
+    # Extract container ID from cgroup path
+    for line in cgroup_content.split("\n"):
+        if "docker" in line and "/" in line:
+            parts = line.strip().split("/")
+            if len(parts) > 1:
+                return parts[-1][:12]
+    return None
+
+
 class WebUIInterface:
     """
     Web UI Interface for secretGPT
@@ -181,7 +215,7 @@ class WebUIInterface:
                                 event_data["error"] = chunk_response.get("error")
 
                             # Send as SSE format
-                            sse_data = f"data: {json.dumps(event_data)}\n\n"
+                            sse_data = f"data: {json_dumps(event_data)}\n\n"
                             yield sse_data
                             
                     except Exception as e:
@@ -195,7 +229,7 @@ class WebUIInterface:
                                 "metadata": {"error": True}
                             }
                         }
-                        yield f"data: {json.dumps(error_event)}\n\n"
+                        yield f"data: {json_dumps(error_event)}\n\n"
                 
                 return StreamingResponse(
                     event_generator(),
@@ -398,8 +432,7 @@ class WebUIInterface:
     
     async def _get_container_info(self) -> dict:
         """Get information about the running Docker container"""
-        import os
-        import subprocess
+        import asyncio
         import json
         from datetime import datetime
         
@@ -413,48 +446,36 @@ class WebUIInterface:
             }
             
             # If running in Docker, try to get more info
-            try:
-                # Check if we're in a container by looking for .dockerenv
-                if os.path.exists("/.dockerenv"):
-                    # Try to get container ID from cgroup
-                    with open("/proc/self/cgroup", "r") as f:
-                        cgroup_content = f.read()
-                        # Extract container ID from cgroup path
-                        for line in cgroup_content.split("\n"):
-                            if "docker" in line and "/" in line:
-                                # Extract potential container ID
-                                parts = line.strip().split("/")
-                                if len(parts) > 1:
-                                    container_id = parts[-1][:12]  # First 12 chars
-                                    break
-                    
-                    # Try to get image info from Docker if available
+            container_id = _docker_container_id()
+            if container_id:
+                # Try to get image info from Docker if available
+                # (async subprocess so the event loop keeps serving other requests)
+                try:
+                    process = await asyncio.create_subprocess_exec(
+                        "docker", "inspect", container_id,
+                        stdout=asyncio.subprocess.PIPE,
+                        stderr=asyncio.subprocess.DEVNULL
+                    )
                     try:
-                        result = subprocess.run(
-                            ["docker", "inspect", container_id],
-                            capture_output=True,
-                            text=True,
-                            timeout=5
-                        )
-                        if result.returncode == 0:
-                            inspect_data = json.loads(result.stdout)[0]
-                            image_info = inspect_data.get("Config", {})
-                            
-                            # Extract image information
-                            if "Image" in inspect_data:
-                                container_info["image_sha"] = inspect_data["Image"]
-                            
-                            # Get creation time
-                            if "Created" in inspect_data:
-                                container_info["build_time"] = inspect_data["Created"]
-                                
-                    except (subprocess.TimeoutExpired, subprocess.CalledProcessError, json.JSONDecodeError):
-                        # Docker commands not available or failed, use fallback
-                        pass
+                        stdout, _ = await asyncio.wait_for(process.communicate(), timeout=5)
+                    except asyncio.TimeoutError:
+                        process.kill()
+                        await process.wait()
+                        raise
+                    if process.returncode == 0:
+                        inspect_data = json.loads(stdout)[0]
+                        
+                        # Extract image information
+                        if "Image" in inspect_data:
+                            container_info["image_sha"] = inspect_data["Image"]
                         
-            except (OSError, IOError):
-                # Not in container or can't read cgroup info
-                pass
+                        # Get creation time
+                        if "Created" in inspect_data:
+                            container_info["build_time"] = inspect_data["Created"]
+                            
+                except (OSError, asyncio.TimeoutError, json.JSONDecodeError):
+                    # Docker commands not available or failed, use fallback
+                    pass
             
             # Set reasonable defaults if still unknown
             if container_info["image_name"] == "unknown":
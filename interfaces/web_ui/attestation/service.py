@@ -5,11 +5,16 @@ REFERENCE: secretVM-full-verification.txt (VM attestation endpoint)
 """
 import asyncio
 import logging
-import json
+import os
 import re
+import socket
+import struct
+import subprocess
+import time
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass
+from urllib.parse import urlparse
 import httpx
 import ssl
 import hashlib
@@ -17,6 +22,55 @@ import hashlib
 logger = logging.getLogger(__name__)
 
 
+# Exact byte offsets verified from example attestation files:
+# report data: bytes 64-96 (32 bytes), MRTD: bytes 184-232 (48 bytes / 384 bits),
+# RTMR0-3: bytes 376-568 (4 x 48 bytes / 384 bits), unpacked in a single call
+QUOTE_FIELDS = ("report_data", "mrtd", "rtmr0", "rtmr1", "rtmr2", "rtmr3")
+_QUOTE_STRUCT = struct.Struct("<64x32s88x48s144x48s48s48s48s")
+_QUOTE_HEX_PREFIX = 2 * _QUOTE_STRUCT.size
+
+# Patterns used to locate the hex quote in attestation endpoint HTML
+PRE_QUOTE_PATTERN = re.compile(r'<pre[^>]*>([0-9a-fA-F]+)</pre>', re.DOTALL)
+TEXTAREA_QUOTE_PATTERN = re.compile(r'id="quoteTextarea"[^>]*>([0-9a-fA-F]+)<')
+HEX_QUOTE_PATTERN = re.compile(r'[0-9a-fA-F]{2000,}')
+
+
+# Default gateway IP, remembered once a lookup succeeds
+_default_gateway_ip: Optional[str] = None
+
+
+def _get_default_gateway_ip() -> Optional[str]:
+    """
+    Get the default gateway IP from `ip route show default`
+
+    A successful lookup is kept for the life of the process, since endpoint
+    discovery consults the gateway from more than one fallback path. Failed
+    lookups are not remembered, so a transient error is retried next time.
+    """
+    global _default_gateway_ip
+    if _default_gateway_ip is None:
+        _default_gateway_ip = _query_default_gateway_ip()
+    return _default_gateway_ip
+
+
+def _query_default_gateway_ip() -> Optional[str]:
+    """Run `ip route show default` and extract the gateway IP"""
+    try:
+        result = subprocess.run(['ip', 'route', 'show', 'default'],
+                                capture_output=True, timeout=10)
+    except Exception as e:
+        logger.warning(f"Could not get gateway IP: {e}")
+        return None
+
+    if result.returncode == 0:
+        # Extract gateway IP from output like "default via 172.18.0.1 dev eth0";
+        # stdout stays bytes and only the address itself is decoded
+        for line in result.stdout.splitlines():
+            if b'default via' in line:
+                return line.split(b'via')[1].split()[0].decode('ascii', 'replace')
+    return None
+
+
 @dataclass
 class AttestationData:
     """Structured attestation data"""
@@ -39,7 +93,8 @@ class AttestationService:
     
     def __init__(self, secret_ai_service=None):
         """Initialize the attestation service"""
-        self.cache: Dict[str, AttestationData] = {}
+        # cache_key -> (attestation, monotonic expiry time)
+        self.cache: Dict[str, Tuple[AttestationData, float]] = {}
         self.cache_ttl = timedelta(minutes=5)  # Attestation caching with TTL
         
         # Enhanced HTTP client for SecretVM self-signed certificates
@@ -65,9 +120,6 @@ class AttestationService:
         Get self-attestation endpoint using VM IP + port pattern
         REFERENCE: secretVM-full-verification.txt - <your_machine_url>:29343/cpu.html
         """
-        import os
-        import socket
-        
         # Check for environment variable override
         vm_endpoint = os.getenv("SECRETGPT_ATTESTATION_ENDPOINT")
         if vm_endpoint:
@@ -87,21 +139,12 @@ class AttestationService:
             logger.debug(f"host.docker.internal not available: {e}")
         
         # Method 2: Try to get the Docker host gateway IP
-        try:
-            import subprocess
-            result = subprocess.run(['ip', 'route', 'show', 'default'], 
-                                  capture_output=True, text=True, timeout=10)
-            if result.returncode == 0:
-                # Extract gateway IP from output like "default via 172.18.0.1 dev eth0"
-                for line in result.stdout.split('\n'):
-                    if 'default via' in line:
-                        gateway_ip = line.split('via')[1].split()[0]
-                        endpoint = f"https://{gateway_ip}:29343/cpu.html"
-                        logger.info(f"Using Docker gateway IP: {gateway_ip}")
-                        logger.info(f"Self attestation endpoint: {endpoint}")
-                        return endpoint
-        except Exception as e:
-            logger.warning(f"Could not get gateway IP: {e}")
+        gateway_ip = _get_default_gateway_ip()
+        if gateway_ip:
+            endpoint = f"https://{gateway_ip}:29343/cpu.html"
+            logger.info(f"Using Docker gateway IP: {gateway_ip}")
+            logger.info(f"Self attestation endpoint: {endpoint}")
+            return endpoint
         
         # Get the actual VM IP address (not Docker container IP)
         try:
@@ -117,33 +160,22 @@ class AttestationService:
                 logger.info("Attempting to find host VM IP...")
                 
                 # Method 1a: Try to get the default gateway (likely the host)
-                try:
-                    import subprocess
-                    result = subprocess.run(['ip', 'route', 'show', 'default'], 
-                                          capture_output=True, text=True, timeout=10)
-                    if result.returncode == 0:
-                        # Extract gateway IP from output like "default via 172.18.0.1 dev eth0"
-                        for line in result.stdout.split('\n'):
-                            if 'default via' in line:
-                                gateway_ip = line.split('via')[1].split()[0]
-                                logger.info(f"Found gateway IP: {gateway_ip}")
-                                # Gateway is usually host in Docker, but we need external IP
-                                break
-                except Exception as e:
-                    logger.warning(f"Could not get gateway IP: {e}")
+                gateway_ip = _get_default_gateway_ip()
+                if gateway_ip:
+                    logger.info(f"Found gateway IP: {gateway_ip}")
+                    # Gateway is usually host in Docker, but we need external IP
                 
                 # Method 1b: Try to resolve hostname to external IP
                 try:
-                    import subprocess
                     result = subprocess.run(['hostname', '-I'], 
-                                          capture_output=True, text=True, timeout=10)
+                                          capture_output=True, timeout=10)
                     if result.returncode == 0:
-                        ips = result.stdout.strip().split()
+                        ips = result.stdout.split()
                         for ip in ips:
                             # Look for non-Docker IPs (not 172.x.x.x or 127.x.x.x)
-                            if not ip.startswith(("172.", "127.", "169.254.")):
-                                logger.info(f"Found potential host IP: {ip}")
-                                vm_ip = ip
+                            if not ip.startswith((b"172.", b"127.", b"169.254.")):
+                                vm_ip = ip.decode('ascii', 'replace')
+                                logger.info(f"Found potential host IP: {vm_ip}")
                                 break
                         else:
                             logger.warning("No suitable external IP found, using discovered IP")
@@ -198,7 +230,7 @@ class AttestationService:
         # Check cache
         if self._is_cached_valid(cache_key):
             logger.info("Returning cached self VM attestation")
-            return self._format_attestation_response(self.cache[cache_key])
+            return self._format_attestation_response(self.cache[cache_key][0])
         
         try:
             logger.info(f"Fetching self VM attestation from {self.SELF_ATTESTATION_ENDPOINT}")
@@ -236,7 +268,7 @@ class AttestationService:
             )
             
             # Cache the result
-            self.cache[cache_key] = attestation_data
+            self.cache[cache_key] = (attestation_data, time.monotonic() + self.cache_ttl.total_seconds())
             
             logger.info("Self VM attestation retrieved successfully")
             return self._format_attestation_response(attestation_data)
@@ -255,7 +287,7 @@ class AttestationService:
         # Check cache
         if self._is_cached_valid(cache_key):
             logger.info("Returning cached Secret AI VM attestation")
-            return self._format_attestation_response(self.cache[cache_key])
+            return self._format_attestation_response(self.cache[cache_key][0])
         
         try:
             # Discover Secret AI attestation endpoint from SDK
@@ -286,7 +318,7 @@ class AttestationService:
             )
             
             # Cache the result
-            self.cache[cache_key] = attestation_data
+            self.cache[cache_key] = (attestation_data, time.monotonic() + self.cache_ttl.total_seconds())
             
             logger.info("Secret AI VM attestation retrieved successfully")
             return self._format_attestation_response(attestation_data)
@@ -341,35 +373,33 @@ class AttestationService:
         """
         # Look for attestation quote in the HTML - it's typically in <pre> tags
         # Updated pattern to handle class attribute in pre tag
-        quote_pattern = r'<pre[^>]*>([0-9a-fA-F]+)</pre>'
-        matches = re.findall(quote_pattern, html_content, re.DOTALL)
+        matches = PRE_QUOTE_PATTERN.findall(html_content)
         
         if matches:
             # Return the first substantial quote found
             for match in matches:
                 cleaned = match.strip()
                 # Attestation quotes are long hex strings (typically 2000+ chars)
-                if len(cleaned) > 1000 and re.match(r'^[0-9a-fA-F]+$', cleaned):
+                if len(cleaned) > 1000:
                     logger.info(f"Found attestation quote in <pre> tag: {len(cleaned)} characters")
                     return cleaned
         
         # Also try to find hex data with id="quoteTextarea" pattern
-        textarea_pattern = r'id="quoteTextarea"[^>]*>([0-9a-fA-F]+)<'
-        textarea_matches = re.findall(textarea_pattern, html_content)
+        textarea_match = TEXTAREA_QUOTE_PATTERN.search(html_content)
         
-        if textarea_matches:
-            cleaned = textarea_matches[0].strip()
+        if textarea_match:
+            cleaned = textarea_match.group(1).strip()
             if len(cleaned) > 1000:
                 logger.info(f"Found attestation quote in textarea: {len(cleaned)} characters")
                 return cleaned
         
         # Fallback: Look for long hex strings (2000+ characters)
-        hex_pattern = r'([0-9a-fA-F]{2000,})'
-        hex_matches = re.findall(hex_pattern, html_content)
+        hex_match = HEX_QUOTE_PATTERN.search(html_content)
         
-        if hex_matches:
-            logger.info(f"Found raw hex attestation quote: {len(hex_matches[0])} characters")
-            return hex_matches[0]
+        if hex_match:
+            quote = hex_match.group(0)
+            logger.info(f"Found raw hex attestation quote: {len(quote)} characters")
+            return quote
         
         # If no quote found in HTML, log warning and return empty
         logger.warning("No attestation quote found in HTML response")
@@ -404,51 +434,20 @@ class AttestationService:
             # Parse hex quote to extract attestation fields
             # Using exact byte positions from TDX quote structure analysis
             
-            # Convert hex string to bytes for parsing
-            quote_bytes = bytes.fromhex(quote)
-            
-            # Exact byte offsets verified from example attestation files:
-            # MRTD: Bytes 184-232 (48 bytes / 384 bits)
-            # RTMR0: Bytes 376-424 (48 bytes / 384 bits)  
-            # RTMR1: Bytes 424-472 (48 bytes / 384 bits)
-            # RTMR2: Bytes 472-520 (48 bytes / 384 bits)
-            # RTMR3: Bytes 520-568 (48 bytes / 384 bits)
-            
-            # Extract MRTD (48 bytes at offset 184)
-            mrtd_bytes = quote_bytes[184:232]
-            mrtd = mrtd_bytes.hex()
-            
-            # Extract RTMR0 (48 bytes at offset 376)
-            rtmr0_bytes = quote_bytes[376:424]
-            rtmr0 = rtmr0_bytes.hex()
-            
-            # Extract RTMR1 (48 bytes at offset 424)
-            rtmr1_bytes = quote_bytes[424:472]
-            rtmr1 = rtmr1_bytes.hex()
-            
-            # Extract RTMR2 (48 bytes at offset 472)
-            rtmr2_bytes = quote_bytes[472:520]
-            rtmr2 = rtmr2_bytes.hex()
-            
-            # Extract RTMR3 (48 bytes at offset 520)
-            rtmr3_bytes = quote_bytes[520:568]
-            rtmr3 = rtmr3_bytes.hex()
-            
-            # Report data (64 bytes near the beginning of quote)
-            report_data_bytes = quote_bytes[64:96]  # 32 bytes
-            report_data = report_data_bytes.hex()
+            # Decode only the hex prefix covering the fields (not the whole
+            # multi-KB quote) and unpack them all together
+            quote_bytes = bytes.fromhex(quote[:_QUOTE_HEX_PREFIX])
+            fields = {
+                name: value.hex()
+                for name, value in zip(QUOTE_FIELDS, _QUOTE_STRUCT.unpack_from(quote_bytes))
+            }
             
             logger.info(f"Successfully parsed attestation quote for {vm_type}")
-            logger.info(f"MRTD: {mrtd[:32]}...")
-            logger.info(f"RTMR0: {rtmr0[:32]}...")
+            logger.info(f"MRTD: {fields['mrtd'][:32]}...")
+            logger.info(f"RTMR0: {fields['rtmr0'][:32]}...")
             
             return AttestationData(
-                mrtd=mrtd,
-                rtmr0=rtmr0,
-                rtmr1=rtmr1,
-                rtmr2=rtmr2,
-                rtmr3=rtmr3,
-                report_data=report_data,
+                **fields,
                 certificate_fingerprint=cert_fingerprint,
                 timestamp=timestamp,
                 raw_quote=quote
@@ -477,7 +476,6 @@ class AttestationService:
         """
         try:
             # Extract hostname and port from URL
-            from urllib.parse import urlparse
             parsed = urlparse(url)
             hostname = parsed.hostname or "localhost"
             port = parsed.port or 29343
@@ -491,7 +489,6 @@ class AttestationService:
             context.set_ciphers('DEFAULT:@SECLEVEL=0')  # Accept weaker ciphers for SecretVM
             
             # Add connection timeout
-            import socket
             sock = socket.create_connection((hostname, port), timeout=30)
             
             with context.wrap_socket(sock, server_hostname=hostname) as ssock:
@@ -511,12 +508,8 @@ class AttestationService:
     
     def _is_cached_valid(self, cache_key: str) -> bool:
         """Check if cached attestation is still valid"""
-        if cache_key not in self.cache:
-            return False
-        
-        attestation = self.cache[cache_key]
-        age = datetime.utcnow() - attestation.timestamp
-        return age < self.cache_ttl
+        entry = self.cache.get(cache_key)
+        return entry is not None and time.monotonic() < entry[1]
     
     def _format_attestation_response(self, attestation: AttestationData) -> Dict[str, Any]:
         """Format attestation data for API response"""
@@ -563,7 +556,6 @@ class AttestationService:
             # Example: https://secretai-rytn.scrtlabs.com:21434/v1 -> secretai-rytn.scrtlabs.com
             api_url = base_url
             
-            from urllib.parse import urlparse
             parsed = urlparse(api_url)
             hostname = parsed.hostname
             
@@ -5,7 +5,6 @@ MIGRATE: Existing proof generation logic but integrate with hub's Secret AI serv
 """
 import json
 import logging
-import tempfile
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, Optional
@@ -79,8 +78,9 @@ class ProofManager:
                 }
             }
             
-            # Convert to JSON
-            proof_json = json.dumps(proof_data, indent=2)
+            # Convert to compact JSON - the payload is encrypted, so indentation
+            # only inflates what gets serialized, encrypted and written
+            proof_json = json.dumps(proof_data, separators=(",", ":"))
             
             # Encrypt the proof data
             encrypted_proof = self._encrypt_data(proof_json, password)
@@ -3,7 +3,6 @@ Web UI Service Integration with Hub Router
 REFERENCE: Phase 1 Secret AI service for chat integration
 """
 import logging
-from pathlib import Path
 
 from hub.core.router import HubRouter, ComponentType
 from interfaces.web_ui.app import WebUIInterface
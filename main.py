@@ -13,17 +13,17 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 # CRITICAL: Load .env file early for secretVM deployment
-from dotenv import load_dotenv
-load_dotenv()
+from config.settings import load_env_file
+load_env_file(str(Path(__file__).parent / ".env"))
 
 from hub.core.router import HubRouter, ComponentType
 from services.secret_ai.client import SecretAIService
 from services.mcp_service.http_mcp_service import HTTPMCPService
-from config.settings import settings, validate_settings
+from config.settings import get_settings, validate_settings
 
 # Configure logging
 logging.basicConfig(
-    level=getattr(logging, settings.log_level.upper()),
+    level=getattr(logging, get_settings().log_level.upper()),
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
@@ -47,12 +47,9 @@ async def test_secret_ai_integration():
     # Initialize the hub
     await hub.initialize()
     
-    # Get system status
-    status = await hub.get_system_status()
+    # Get system status and available models
+    status, models = await asyncio.gather(hub.get_system_status(), hub.get_available_models())
     logger.info(f"System status: {status}")
-    
-    # Get available models
-    models = await hub.get_available_models()
     logger.info(f"Available models: {models}")
     
     # Test message routing
@@ -132,12 +129,9 @@ async def run_service_mode():
         # Initialize the hub
         await hub.initialize()
         
-        # Get system status
-        status = await hub.get_system_status()
+        # Get system status and available models
+        status, models = await asyncio.gather(hub.get_system_status(), hub.get_available_models())
         logger.info(f"System status: {status}")
-        
-        # Get available models
-        models = await hub.get_available_models()
         logger.info(f"Available models: {models}")
         
         logger.info("secretGPT Hub service started successfully")
@@ -261,19 +255,16 @@ async def run_with_web_ui():
         
         config = uvicorn.Config(
             app=app,
-            host=os.getenv("SECRETGPT_HUB_HOST", "0.0.0.0"),
-            port=int(os.getenv("SECRETGPT_HUB_PORT", "8000")),
-            log_level=settings.log_level.lower(),
+            host=get_settings().hub_host,
+            port=get_settings().hub_port,
+            log_level=get_settings().log_level.lower(),
             access_log=True
         )
         server = uvicorn.Server(config)
         
-        # Get system status
-        status = await hub.get_system_status()
+        # Get system status and available models
+        status, models = await asyncio.gather(hub.get_system_status(), hub.get_available_models())
         logger.info(f"System status: {status}")
-        
-        # Get available models
-        models = await hub.get_available_models()
         logger.info(f"Available models: {models}")
         
         mode_info = "Multi-UI (AttestAI + SecretGPTee)" if dual_domain_mode else "Single Web UI (AttestAI)"
@@ -383,7 +374,7 @@ async def main():
 
     # Determine run mode
     run_mode = os.getenv("SECRETGPT_RUN_MODE", "service").lower()
-    web_ui_enabled = os.getenv("SECRETGPT_ENABLE_WEB_UI", "false").lower() == "true"
+    web_ui_enabled = get_settings().enable_web_ui
 
     # Support command-line arguments for backward compatibility
     if "--webui" in sys.argv or "--web-ui" in sys.argv:
@@ -411,9 +402,9 @@ async def main():
 
 if __name__ == "__main__":
     try:
-        logger.info(f"Command-line arguments: {sys.argv}")
-        logger.info(f"Environment: SECRETGPT_ENABLE_WEB_UI={os.getenv('SECRETGPT_ENABLE_WEB_UI', 'not set')}")
-        logger.info(f"Environment: SECRET_AI_API_KEY={'set' if os.getenv('SECRET_AI_API_KEY') else 'not set'}")
+        logger.info("Command-line arguments: %s", sys.argv)
+        logger.info("Environment: SECRETGPT_ENABLE_WEB_UI=%s", os.getenv('SECRETGPT_ENABLE_WEB_UI', 'not set'))
+        logger.info("Environment: SECRET_AI_API_KEY=%s", 'set' if os.getenv('SECRET_AI_API_KEY') else 'not set')
         asyncio.run(main())
     except KeyboardInterrupt:
         logger.info("Received keyboard interrupt, shutting down gracefully")
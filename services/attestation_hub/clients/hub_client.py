@@ -274,29 +274,38 @@ class AttestationHubClient:
         logger.info("AttestationHubClient cleanup complete")
 
 
+# Shared clients for the convenience functions, one pooled client per hub URL
+_shared_clients: Dict[str, AttestationHubClient] = {}
+
+
+def get_shared_client(hub_url: str = "http://localhost:8080") -> AttestationHubClient:
+    """Get the process-wide client for a hub URL, creating it on first use"""
+    client = _shared_clients.get(hub_url)
+    if client is None:
+        client = AttestationHubClient(hub_url)
+        _shared_clients[hub_url] = client
+    return client
+
+
+async def close_shared_clients():
+    """Close all shared clients (call on application shutdown)"""
+    clients = list(_shared_clients.values())
+    _shared_clients.clear()
+    for client in clients:
+        await client.cleanup()
+
+
 # Convenience functions for common usage patterns
 async def get_secretgpt_attestation(hub_url: str = "http://localhost:8080") -> AttestationData:
     """Get secretGPT attestation (convenience function)"""
-    client = AttestationHubClient(hub_url)
-    try:
-        return await client.get_attestation("secretgpt")
-    finally:
-        await client.cleanup()
+    return await get_shared_client(hub_url).get_attestation("secretgpt")
 
 
 async def get_secretai_attestation(hub_url: str = "http://localhost:8080") -> AttestationData:
     """Get secretAI attestation (convenience function)"""
-    client = AttestationHubClient(hub_url)
-    try:
-        return await client.get_attestation("secretai")
-    finally:
-        await client.cleanup()
+    return await get_shared_client(hub_url).get_attestation("secretai")
 
 
 async def get_dual_verification(hub_url: str = "http://localhost:8080") -> DualAttestationData:
     """Get dual attestation verification (convenience function)"""
-    client = AttestationHubClient(hub_url)
-    try:
-        return await client.get_dual_attestation()
-    finally:
-        await client.cleanup()
\ No newline at end of file
+    return await get_shared_client(hub_url).get_dual_attestation()
@@ -1,9 +1,16 @@
 """Data models for attestation hub"""
 
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional, Dict, Any, List
 from enum import Enum
+from operator import attrgetter
+
+
+# Measurement fields compared against known-good baselines
+BASELINE_FIELDS = ("mrtd", "rtmr0", "rtmr1", "rtmr2", "rtmr3", "report_data")
+get_baseline_fields = attrgetter(*BASELINE_FIELDS)
 
 
 class ParsingMethod(str, Enum):
@@ -21,7 +28,7 @@ class ServiceStatus(str, Enum):
     UNHEALTHY = "unhealthy"
 
 
-@dataclass
+@dataclass(slots=True)
 class AttestationData:
     """Structured attestation data matching secretGPT format"""
     vm_name: str
@@ -56,13 +63,8 @@ class AttestationData:
     
     def matches_baseline(self, baseline: Dict[str, str]) -> bool:
         """Check if attestation matches baseline values"""
-        return (
-            self.mrtd == baseline.get("mrtd", "") and
-            self.rtmr0 == baseline.get("rtmr0", "") and
-            self.rtmr1 == baseline.get("rtmr1", "") and
-            self.rtmr2 == baseline.get("rtmr2", "") and
-            self.rtmr3 == baseline.get("rtmr3", "") and
-            self.report_data == baseline.get("report_data", "")
+        return get_baseline_fields(self) == tuple(
+            baseline.get(name, "") for name in BASELINE_FIELDS
         )
 
 
@@ -136,16 +138,15 @@ class ServiceHealth:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class CacheEntry:
     """Cache entry with TTL"""
     data: AttestationData
-    created_at: datetime
+    created_at: float = field(default_factory=time.monotonic)  # monotonic seconds
     
     def is_expired(self, ttl_seconds: int) -> bool:
         """Check if cache entry is expired"""
-        age = (datetime.utcnow() - self.created_at).total_seconds()
-        return age > ttl_seconds
+        return time.monotonic() - self.created_at > ttl_seconds
 
 
 class AttestationError(Exception):
@@ -2,10 +2,13 @@
 
 import asyncio
 import logging
+import time
 import uuid
-from datetime import datetime, timedelta
+from datetime import datetime
+from functools import lru_cache
 from typing import Dict, Optional, List, Tuple
 from collections import OrderedDict
+from pathlib import Path
 
 from config.settings import ConfigManager
 from hub.models import (
@@ -14,10 +17,31 @@ from hub.models import (
     CacheEntry
 )
 from hub.vm_manager import VMManager
-from parsers.base import ParserFactory
+from parsers.base import BaseParser, ParserFactory
 
 logger = logging.getLogger(__name__)
 
+# Sample quote used until real quote retrieval is implemented
+SAMPLE_QUOTE_FILE = (
+    Path(__file__).resolve().parent.parent.parent
+    / "experiments/attest_tool_research/sample_data/known_good_quote.hex"
+)
+
+
+@lru_cache(maxsize=4)
+def _read_quote_file(path: str, mtime_ns: int) -> str:
+    """Read a quote file; cached per (path, mtime) so repeat calls skip the read"""
+    with open(path, 'r') as f:
+        return f.read().strip()
+
+
+def _read_sample_quote() -> Optional[str]:
+    """Read the sample quote file, or None if it is unavailable"""
+    try:
+        return _read_quote_file(str(SAMPLE_QUOTE_FILE), SAMPLE_QUOTE_FILE.stat().st_mtime_ns)
+    except OSError:
+        return None
+
 
 class AttestationHub:
     """Main orchestration service for multi-VM attestation"""
@@ -26,7 +50,9 @@ class AttestationHub:
         self.config_manager = config_manager
         self.vm_manager = VMManager(config_manager)
         self.cache: OrderedDict[str, CacheEntry] = OrderedDict()
+        self.parsers: Dict[str, BaseParser] = {}
         self.start_time = datetime.utcnow()
+        self._started_monotonic = time.monotonic()  # for uptime; immune to clock changes
         self.cache_hits = 0
         self.cache_misses = 0
         
@@ -54,11 +80,12 @@ class AttestationHub:
             raise AttestationError(f"VM not configured: {vm_name}")
         
         # Try primary parsing strategy
-        primary_parser = ParserFactory.create_parser(vm_config.parsing_strategy)
+        primary_parser = self._get_parser(vm_config.parsing_strategy)
         if not primary_parser:
             raise AttestationError(f"Parser not found: {vm_config.parsing_strategy}")
         
         last_error = None
+        quote = None
         
         try:
             logger.info(f"Attempting {vm_config.parsing_strategy} parsing for {vm_name}")
@@ -86,12 +113,14 @@ class AttestationHub:
         
         # Try fallback strategy if configured
         if vm_config.fallback_strategy:
-            fallback_parser = ParserFactory.create_parser(vm_config.fallback_strategy)
+            fallback_parser = self._get_parser(vm_config.fallback_strategy)
             if fallback_parser:
                 try:
                     logger.info(f"Attempting fallback {vm_config.fallback_strategy} for {vm_name}")
                     
-                    quote = await self._fetch_quote_from_vm(vm_name, vm_config)
+                    # Reuse the quote fetched for the primary attempt if we have it
+                    if quote is None:
+                        quote = await self._fetch_quote_from_vm(vm_name, vm_config)
                     attestation = await fallback_parser.parse_attestation(
                         quote, vm_config, certificate_fingerprint=""
                     )
@@ -111,6 +140,16 @@ class AttestationHub:
         
         raise AttestationError(f"All parsing strategies failed for {vm_name}: {last_error}")
     
+    def _get_parser(self, strategy: str) -> Optional[BaseParser]:
+        """Get the shared parser instance for a strategy, creating it on first use"""
+        
+        parser = self.parsers.get(strategy)
+        if parser is None:
+            parser = ParserFactory.create_parser(strategy)
+            if parser:
+                self.parsers[strategy] = parser
+        return parser
+    
     async def get_dual_attestation(self) -> DualAttestationData:
         """Get secretAI + secretGPT attestations"""
         
@@ -208,17 +247,10 @@ class AttestationHub:
         # 3. Return the hex-encoded quote string
         
         # For testing, load from sample data if available
-        try:
-            import os
-            sample_file = os.path.join(
-                os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-                "experiments/attest_tool_research/sample_data/known_good_quote.hex"
-            )
-            if os.path.exists(sample_file):
-                with open(sample_file, 'r') as f:
-                    return f.read().strip()
-        except:
-            pass
+        # (read in a worker thread so the event loop is not blocked on disk I/O)
+        quote = await asyncio.to_thread(_read_sample_quote)
+        if quote is not None:
+            return quote
         
         # Placeholder quote
         raise VMConnectionError(f"Quote retrieval not implemented for {vm_name}")
@@ -241,15 +273,25 @@ class AttestationHub:
     def _cache_attestation(self, vm_name: str, attestation: AttestationData):
         """Cache attestation data"""
         
-        # Enforce cache size limit
-        if len(self.cache) >= self.config_manager.cache_config.max_size:
-            # Remove oldest entry
-            self.cache.popitem(last=False)
+        # Enforce cache size limit (refreshing an existing key needs no room)
+        if vm_name not in self.cache and len(self.cache) >= self.config_manager.cache_config.max_size:
+            self._evict_cache_entry()
         
-        self.cache[vm_name] = CacheEntry(
-            data=attestation,
-            created_at=datetime.utcnow()
-        )
+        self.cache[vm_name] = CacheEntry(data=attestation)
+    
+    def _evict_cache_entry(self):
+        """Make room for one entry, dropping the one with the least TTL remaining"""
+        
+        ttl = self.config_manager.cache_config.ttl
+        expired = [name for name, entry in self.cache.items() if entry.is_expired(ttl)]
+        if expired:
+            for name in expired:
+                del self.cache[name]
+            return
+        
+        # All entries share one TTL, so the earliest created expires first
+        victim = min(self.cache, key=lambda name: self.cache[name].created_at)
+        del self.cache[victim]
     
     def get_cache_hit_rate(self) -> float:
         """Calculate cache hit rate"""
@@ -273,7 +315,7 @@ class AttestationHub:
         else:
             status = ServiceStatus.UNHEALTHY
         
-        uptime = (datetime.utcnow() - self.start_time).total_seconds()
+        uptime = time.monotonic() - self._started_monotonic
         
         return ServiceHealth(
             status=status,
@@ -288,8 +330,8 @@ class AttestationHub:
     async def cleanup(self):
         """Cleanup resources"""
         logger.info("Cleaning up AttestationHub resources")
-        # Clean up any parser resources
-        for parser_name in ParserFactory.list_parsers():
-            parser = ParserFactory.create_parser(parser_name)
+        # Clean up the parser instances that were actually used
+        for parser in self.parsers.values():
             if hasattr(parser, 'cleanup'):
-                await parser.cleanup()
\ No newline at end of file
+                await parser.cleanup()
+        self.parsers.clear()
\ No newline at end of file
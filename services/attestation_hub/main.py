@@ -1,6 +1,5 @@
 """Main entry point for Attestation Hub Service"""
 
-import asyncio
 import logging
 import logging.config
 import os
@@ -1,7 +1,6 @@
 """Intel DCAP parser (future implementation)"""
 
 import logging
-from datetime import datetime
 
 from parsers.base import BaseParser, ParserFactory
 from config.settings import VMConfig
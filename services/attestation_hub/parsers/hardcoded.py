@@ -5,7 +5,7 @@ from datetime import datetime
 
 from parsers.base import BaseParser, ParserFactory
 from config.settings import VMConfig
-from hub.models import AttestationData, ParsingError
+from hub.models import AttestationData, ParsingError, BASELINE_FIELDS, get_baseline_fields
 
 logger = logging.getLogger(__name__)
 
@@ -44,7 +44,7 @@ class HardcodedParser(BaseParser):
             rtmr3 = self._extract_field(quote, "rtmr3")
             
             # Validate all fields were extracted
-            if not all([mrtd, rtmr0, rtmr1, rtmr2, rtmr3]):
+            if not (mrtd and rtmr0 and rtmr1 and rtmr2 and rtmr3):
                 raise ParsingError("Failed to extract all required fields")
             
             # Get VM name from endpoint
@@ -92,12 +92,8 @@ class HardcodedParser(BaseParser):
     def validate_baseline(self, attestation_data: AttestationData, baseline: dict) -> dict:
         """Validate parsed data against baseline"""
         validation = {
-            "mrtd_match": attestation_data.mrtd == baseline.get("mrtd", ""),
-            "rtmr0_match": attestation_data.rtmr0 == baseline.get("rtmr0", ""),
-            "rtmr1_match": attestation_data.rtmr1 == baseline.get("rtmr1", ""),
-            "rtmr2_match": attestation_data.rtmr2 == baseline.get("rtmr2", ""),
-            "rtmr3_match": attestation_data.rtmr3 == baseline.get("rtmr3", ""),
-            "report_data_match": attestation_data.report_data == baseline.get("report_data", ""),
+            f"{name}_match": actual == baseline.get(name, "")
+            for name, actual in zip(BASELINE_FIELDS, get_baseline_fields(attestation_data))
         }
         
         validation["all_match"] = all(validation.values())
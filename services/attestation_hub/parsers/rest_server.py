@@ -1,32 +1,64 @@
 """REST server parser using secret-vm-attest-rest-server"""
 
+import asyncio
 import httpx
-import json
 import re
+import time
 import logging
 from datetime import datetime
 from typing import Optional, Dict, Any
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    import json
+    _json_loads = json.loads
+
 from parsers.base import BaseParser, ParserFactory
+from parsers.hardcoded import HardcodedParser
 from config.settings import VMConfig
-from hub.models import AttestationData, ParsingError
+from hub.models import AttestationData, ParsingError, BASELINE_FIELDS
 
 logger = logging.getLogger(__name__)
 
+# Long hex run embedded in /cpu HTML/text responses
+HEX_QUOTE_PATTERN = re.compile(rb'[0-9a-fA-F]{2000,}')
+
 
 class RestServerParser(BaseParser):
     """Parser using secret-vm-attest-rest-server endpoints"""
     
+    # Circuit breaker: after this many consecutive failures an endpoint is
+    # skipped for the cool-down period so callers fall back immediately
+    FAILURE_THRESHOLD = 3
+    COOLDOWN_SECONDS = 60.0
+    
+    # Hedged probing: /cpu goes first; /attestation and /self are only
+    # started if it fails or has not answered within this delay
+    HEDGE_DELAY_SECONDS = 0.5
+    
     def __init__(self):
         super().__init__()
         self.client: Optional[httpx.AsyncClient] = None
+        self._failures: Dict[str, int] = {}
+        self._open_until: Dict[str, float] = {}
+        self._hardcoded_parser = HardcodedParser()
     
     async def _get_client(self, vm_config: VMConfig) -> httpx.AsyncClient:
         """Get or create HTTP client"""
         if not self.client:
+            # Keep connections alive between the /cpu, /attestation and /self
+            # probes so each quote pays the TCP/TLS handshake at most once.
+            # The pool timeout is left unset so queued requests are not cancelled.
             self.client = httpx.AsyncClient(
                 verify=vm_config.tls_verify,
-                timeout=httpx.Timeout(vm_config.timeout),
+                timeout=httpx.Timeout(vm_config.timeout, connect=5.0, pool=None),
+                limits=httpx.Limits(
+                    max_connections=100,
+                    max_keepalive_connections=50,
+                    keepalive_expiry=60.0
+                ),
                 headers={'User-Agent': 'attestation-hub/1.0'}
             )
         return self.client
@@ -42,28 +74,67 @@ class RestServerParser(BaseParser):
         if not self.validate_quote(quote):
             raise ParsingError("Invalid quote format")
         
+        endpoint = vm_config.endpoint
+        if time.monotonic() < self._open_until.get(endpoint, 0.0):
+            raise ParsingError(f"REST server {endpoint} unavailable, skipping during cool-down")
+        
         client = await self._get_client(vm_config)
         
-        # Try different endpoints in order
-        methods = [
-            self._try_cpu_endpoint,
+        # Hedged probe: start /cpu, add the fallback endpoints only if it fails
+        # or is slow, take the first usable answer and cancel the rest
+        fallbacks = [
             self._try_attestation_endpoint,
             self._try_self_endpoint
         ]
         
+        names: Dict[asyncio.Task, str] = {}
+        
+        def start(method) -> asyncio.Task:
+            logger.debug(f"Trying {method.__name__} for {vm_config.endpoint}")
+            task = asyncio.create_task(method(client, vm_config, quote, certificate_fingerprint))
+            names[task] = method.__name__
+            return task
+        
+        pending = {start(self._try_cpu_endpoint)}
+        hedged = False
         last_error = None
-        for method in methods:
-            try:
-                logger.debug(f"Trying {method.__name__} for {vm_config.endpoint}")
-                result = await method(client, vm_config, quote, certificate_fingerprint)
-                if result:
-                    return result
-            except Exception as e:
-                last_error = e
-                logger.warning(f"{method.__name__} failed: {e}")
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=None if hedged else self.HEDGE_DELAY_SECONDS,
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    try:
+                        result = task.result()
+                    except Exception as e:
+                        last_error = e
+                        logger.warning(f"{names[task]} failed: {e}")
+                        continue
+                    if result:
+                        self._failures.pop(endpoint, None)
+                        return result
+                if not hedged:
+                    hedged = True
+                    pending.update(start(method) for method in fallbacks)
+        finally:
+            for task in pending:
+                task.cancel()
         
+        self._record_failure(endpoint)
         raise ParsingError(f"All REST server methods failed. Last error: {last_error}")
     
+    def _record_failure(self, endpoint: str):
+        """Count a failed probe round and open the circuit at the threshold"""
+        failures = self._failures.get(endpoint, 0) + 1
+        if failures >= self.FAILURE_THRESHOLD:
+            logger.warning(f"REST server {endpoint} failed {failures} times, "
+                           f"skipping for {self.COOLDOWN_SECONDS:.0f}s")
+            self._open_until[endpoint] = time.monotonic() + self.COOLDOWN_SECONDS
+            failures = 0
+        self._failures[endpoint] = failures
+    
     async def _try_cpu_endpoint(
         self, 
         client: httpx.AsyncClient,
@@ -78,25 +149,25 @@ class RestServerParser(BaseParser):
         if response.status_code != 200:
             return None
         
+        # Work on the raw body bytes; only the matched quote is ever decoded
+        content = response.content
+        
         # Try to parse JSON response first
         try:
             if response.headers.get('content-type', '').startswith('application/json'):
-                data = response.json()
+                data = _json_loads(content)
                 return self._parse_json_response(data, vm_config, quote, cert_fingerprint)
         except:
             pass
         
         # Otherwise try to extract hex quote from HTML/text
-        hex_pattern = r'([0-9a-fA-F]{2000,})'
-        matches = re.findall(hex_pattern, response.text)
+        match = HEX_QUOTE_PATTERN.search(content)
         
-        if matches:
-            extracted_quote = matches[0]
+        if match:
+            extracted_quote = match.group(0).decode('ascii')
             logger.info(f"Extracted quote from /cpu: {len(extracted_quote)} chars")
             # Parse with hardcoded offsets
-            from parsers.hardcoded import HardcodedParser
-            parser = HardcodedParser()
-            return await parser.parse_attestation(extracted_quote, vm_config, cert_fingerprint)
+            return await self._hardcoded_parser.parse_attestation(extracted_quote, vm_config, cert_fingerprint)
         
         return None
     
@@ -119,7 +190,7 @@ class RestServerParser(BaseParser):
             return None
         
         try:
-            data = response.json()
+            data = _json_loads(response.content)
             return self._parse_json_response(data, vm_config, quote, cert_fingerprint)
         except:
             return None
@@ -139,7 +210,7 @@ class RestServerParser(BaseParser):
             return None
         
         try:
-            data = response.json()
+            data = _json_loads(response.content)
             return self._parse_json_response(data, vm_config, quote, cert_fingerprint)
         except:
             return None
@@ -159,12 +230,7 @@ class RestServerParser(BaseParser):
         return AttestationData(
             vm_name=vm_name,
             vm_type=vm_config.type,
-            mrtd=data.get('mrtd', ''),
-            rtmr0=data.get('rtmr0', ''),
-            rtmr1=data.get('rtmr1', ''),
-            rtmr2=data.get('rtmr2', ''),
-            rtmr3=data.get('rtmr3', ''),
-            report_data=data.get('report_data', ''),
+            **{name: data.get(name, '') for name in BASELINE_FIELDS},
             certificate_fingerprint=cert_fingerprint or data.get('certificate_fingerprint', ''),
             timestamp=datetime.utcnow(),
             raw_quote=quote,
@@ -2,39 +2,76 @@
 """Validate attestation hub against baseline data"""
 
 import asyncio
-import json
 import logging
+from functools import lru_cache
 from pathlib import Path
+import statistics
 import sys
+import time
+from typing import Optional
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+    _json_loads = json.loads
 
 from parsers.hardcoded import HardcodedParser
 from config.settings import VMConfig
+from hub.models import BASELINE_FIELDS, get_baseline_fields
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+RESEARCH_DIR = Path(__file__).parent.parent.parent / "experiments/attest_tool_research"
+BASELINE_FILE = RESEARCH_DIR / "findings/current_parser_baseline.json"
+QUOTE_FILE = RESEARCH_DIR / "sample_data/known_good_quote.hex"
+
+
+@lru_cache(maxsize=8)
+def _read_baseline(path: str, mtime_ns: int) -> dict:
+    """Parse a baseline file; cached per (path, mtime) so repeat runs skip disk and JSON"""
+    return _json_loads(Path(path).read_bytes())
+
+
+@lru_cache(maxsize=8)
+def _read_quote(path: str, mtime_ns: int) -> str:
+    """Read a quote file; cached per (path, mtime) like _read_baseline"""
+    return Path(path).read_text().strip()
+
+
+def load_baseline() -> Optional[dict]:
+    """Load the baseline measurements, or None if they are missing"""
+    try:
+        return _read_baseline(str(BASELINE_FILE), BASELINE_FILE.stat().st_mtime_ns)
+    except FileNotFoundError:
+        logger.error(f"Baseline file not found: {BASELINE_FILE}")
+        return None
+
+
+def load_test_quote() -> Optional[str]:
+    """Load the known-good test quote, or None if it is missing"""
+    try:
+        return _read_quote(str(QUOTE_FILE), QUOTE_FILE.stat().st_mtime_ns)
+    except FileNotFoundError:
+        logger.error(f"Test quote file not found: {QUOTE_FILE}")
+        return None
+
 
 async def validate_baseline():
     """Validate parsing against baseline data"""
     
     # Load baseline data
-    baseline_file = Path(__file__).parent.parent.parent / "experiments/attest_tool_research/findings/current_parser_baseline.json"
-    if not baseline_file.exists():
-        logger.error(f"Baseline file not found: {baseline_file}")
+    baseline = load_baseline()
+    if baseline is None:
         return False
     
-    with open(baseline_file, 'r') as f:
-        baseline = json.load(f)
-    
     # Load test quote
-    quote_file = Path(__file__).parent.parent.parent / "experiments/attest_tool_research/sample_data/known_good_quote.hex"
-    if not quote_file.exists():
-        logger.error(f"Test quote file not found: {quote_file}")
+    test_quote = load_test_quote()
+    if test_quote is None:
         return False
     
-    with open(quote_file, 'r') as f:
-        test_quote = f.read().strip()
-    
     logger.info(f"Loaded test quote: {len(test_quote)} characters")
     logger.info(f"Baseline data: {len(baseline)} fields")
     
@@ -50,36 +87,25 @@ async def validate_baseline():
         # Parse the quote
         attestation = await parser.parse_attestation(test_quote, vm_config, "test_cert")
         
-        # Compare with baseline
-        validation_results = {
-            "mrtd_match": attestation.mrtd == baseline["mrtd"],
-            "rtmr0_match": attestation.rtmr0 == baseline["rtmr0"],
-            "rtmr1_match": attestation.rtmr1 == baseline["rtmr1"],
-            "rtmr2_match": attestation.rtmr2 == baseline["rtmr2"],
-            "rtmr3_match": attestation.rtmr3 == baseline["rtmr3"],
-            "report_data_match": attestation.report_data == baseline["report_data"],
-        }
-        
-        all_match = all(validation_results.values())
+        # Compare with baseline in one pass; per-field detail only on mismatch
+        actual = dict(zip(BASELINE_FIELDS, get_baseline_fields(attestation)))
+        expected = {name: baseline[name] for name in BASELINE_FIELDS}
+        all_match = actual == expected
         
         logger.info("=== BASELINE VALIDATION RESULTS ===")
-        for field, matches in validation_results.items():
-            status = "✅ PASS" if matches else "❌ FAIL"
-            logger.info(f"{field}: {status}")
+        for name in BASELINE_FIELDS:
+            status = "✅ PASS" if all_match or actual[name] == expected[name] else "❌ FAIL"
+            logger.info(f"{name}_match: {status}")
         
         logger.info(f"\nOverall validation: {'✅ PASS' if all_match else '❌ FAIL'}")
         
         if not all_match:
             logger.error("\n=== MISMATCHES ===")
-            for field, matches in validation_results.items():
-                if not matches:
-                    field_name = field.replace('_match', '')
-                    baseline_val = baseline.get(field_name, "")
-                    actual_val = getattr(attestation, field_name, "")
-                    
-                    logger.error(f"{field_name}:")
-                    logger.error(f"  Expected: {baseline_val[:64]}...")
-                    logger.error(f"  Actual:   {actual_val[:64]}...")
+            for name in BASELINE_FIELDS:
+                if actual[name] != expected[name]:
+                    logger.error(f"{name}:")
+                    logger.error(f"  Expected: {expected[name][:64]}...")
+                    logger.error(f"  Actual:   {actual[name][:64]}...")
         
         # Additional validation
         logger.info("\n=== FIELD LENGTH VALIDATION ===")
@@ -110,6 +136,35 @@ async def validate_baseline():
         return False
 
 
+async def benchmark_parsing(iterations: int = 1000):
+    """Time the parse-only hot path (no network, no cache)"""
+    
+    logger.info("\n=== PARSING PERFORMANCE ===")
+    
+    test_quote = load_test_quote()
+    if test_quote is None:
+        return
+    
+    parser = HardcodedParser()
+    vm_config = VMConfig(
+        endpoint="https://localhost:29343",
+        type="secret-gpt",
+        parsing_strategy="hardcoded"
+    )
+    
+    execution_times = []
+    for _ in range(iterations):
+        start = time.perf_counter_ns()
+        await parser.parse_attestation(test_quote, vm_config, "test_cert")
+        execution_times.append(time.perf_counter_ns() - start)
+    
+    logger.info(f"Hardcoded parse over {iterations} iterations: "
+                f"mean {statistics.fmean(execution_times) / 1e3:.1f} µs, "
+                f"median {statistics.median(execution_times) / 1e3:.1f} µs, "
+                f"min {min(execution_times) / 1e3:.1f} µs, "
+                f"max {max(execution_times) / 1e3:.1f} µs")
+
+
 async def test_service_startup():
     """Test basic service components"""
     
@@ -162,6 +217,10 @@ async def main():
     # Test 2: Service component test
     service_pass = await test_service_startup()
     
+    # Informational: parse-only timing, not part of pass/fail
+    if baseline_pass:
+        await benchmark_parsing()
+    
     logger.info("\n" + "=" * 50)
     logger.info("VALIDATION SUMMARY")
     logger.info("=" * 50)
@@ -3,7 +3,6 @@ HTTP-based MCP Service for secretGPT Hub Router
 Manages connections to external MCP servers via HTTP API and routes tool/resource requests
 """
 import aiohttp
-import asyncio
 import json
 import logging
 import time
@@ -36,6 +35,7 @@ class HTTPMCPService:
         self.server_status = {}    # server_id -> MCPServerStatus
         self.initialized = False
         self.operation_log = []    # Track operations for attestation
+        self._operation_started_ns = {}  # operation_id -> perf_counter_ns() at start
         self.session = None        # HTTP session
         logger.info("HTTP MCP Service initialized")
     
@@ -73,8 +73,8 @@ class HTTPMCPService:
         
         try:
             # Import settings here to get the configurable URL
-            from config.settings import settings
-            server_url = getattr(settings, 'secret_mcp_url', 'http://10.0.1.100:8002')
+            from config.settings import get_settings
+            server_url = getattr(get_settings(), 'secret_mcp_url', 'http://10.0.1.100:8002')
             
             logger.info(f"Connecting to {server_id} MCP server at {server_url}...")
             
@@ -338,6 +338,7 @@ class HTTPMCPService:
             "data": data,
             "timestamp": time.time()
         })
+        self._operation_started_ns[operation_id] = time.perf_counter_ns()
         
         return operation_id
     
@@ -349,6 +350,9 @@ class HTTPMCPService:
                 operation["status"] = "completed"
                 operation["result"] = result_data
                 operation["completed_at"] = time.time()
+                started_ns = self._operation_started_ns.pop(operation_id, None)
+                if started_ns is not None:
+                    operation["duration_ms"] = (time.perf_counter_ns() - started_ns) / 1e6
                 break
     
     def _hash_result(self, result: Any) -> str:
@@ -5,13 +5,24 @@ Manages connections to multiple MCP servers and routes tool/resource requests
 import asyncio
 import json
 import logging
-import subprocess
+import re
 import time
 from typing import Dict, Any, List, Optional
 from enum import Enum
 
 logger = logging.getLogger(__name__)
 
+# Matches a stdout line whose first non-blank byte opens a JSON object,
+# checked on the raw bytes without decoding or stripping the line
+JSON_LINE_PATTERN = re.compile(rb'\s*\{')
+
+
+async def _send_json_line(stream: asyncio.StreamWriter, message: Dict[str, Any]) -> None:
+    """Write one compact newline-delimited JSON-RPC message to a server's stdin"""
+    stream.write(json.dumps(message, separators=(",", ":")).encode())
+    stream.write(b"\n")
+    await stream.drain()
+
 
 class MCPServerStatus(Enum):
     """Status of MCP server connections"""
@@ -36,6 +47,7 @@ class MCPService:
         self.server_status = {}    # server_id -> MCPServerStatus
         self.initialized = False
         self.operation_log = []    # Track operations for attestation
+        self._operation_started_ns = {}  # operation_id -> perf_counter_ns() at start
         logger.info("MCP Service initialized")
     
     async def initialize(self) -> None:
@@ -66,8 +78,8 @@ class MCPService:
         
         try:
             # Import settings here to get the configurable path
-            from config.settings import settings
-            server_path = settings.mcp_server_path
+            from config.settings import get_settings
+            server_path = get_settings().mcp_server_path
             
             logger.info(f"Connecting to {server_id} MCP server at {server_path}...")
             
@@ -144,9 +156,7 @@ class MCPService:
                 }
                 
                 # Send initialize request
-                request_json = json.dumps(init_request) + "\n"
-                process.stdin.write(request_json.encode())
-                await process.stdin.drain()
+                await _send_json_line(process.stdin, init_request)
                 
                 # Read initialize response
                 init_response_line = await asyncio.wait_for(
@@ -163,9 +173,7 @@ class MCPService:
                     "params": {}
                 }
                 
-                request_json = json.dumps(initialized_notification) + "\n"
-                process.stdin.write(request_json.encode())
-                await process.stdin.drain()
+                await _send_json_line(process.stdin, initialized_notification)
                 
                 # Wait a moment for the server to process the notification
                 await asyncio.sleep(0.2)
@@ -179,9 +187,7 @@ class MCPService:
                 }
                 
                 # Send request to server
-                request_json = json.dumps(request) + "\n"
-                process.stdin.write(request_json.encode())
-                await process.stdin.drain()
+                await _send_json_line(process.stdin, request)
                 
                 # Read response with timeout and retry logic
                 max_attempts = 3
@@ -193,15 +199,11 @@ class MCPService:
                             timeout=5.0
                         )
                         
-                        response_text = response_line.decode().strip()
-                        if not response_text:
-                            continue
-                            
-                        # Skip non-JSON lines (debug output)
-                        if not response_text.startswith('{'):
+                        # Skip blank and non-JSON lines (debug output)
+                        if not JSON_LINE_PATTERN.match(response_line):
                             continue
                             
-                        response_data = json.loads(response_text)
+                        response_data = json.loads(response_line)
                         
                         if "result" in response_data and "tools" in response_data["result"]:
                             tools = response_data["result"]["tools"]
@@ -322,26 +324,22 @@ class MCPService:
             }
             
             # Send request to server
-            request_json = json.dumps(request) + "\n"
-            process.stdin.write(request_json.encode())
-            await process.stdin.drain()
+            await _send_json_line(process.stdin, request)
             
             # Read response with timeout and JSON filtering
             response_line = await asyncio.wait_for(
                 process.stdout.readline(), 
                 timeout=10.0
             )
-            response_text = response_line.decode().strip()
             
             # Skip non-JSON lines (debug output)
-            while response_text and not response_text.startswith('{'):
+            while response_line and not JSON_LINE_PATTERN.match(response_line):
                 response_line = await asyncio.wait_for(
                     process.stdout.readline(), 
                     timeout=10.0
                 )
-                response_text = response_line.decode().strip()
             
-            response_data = json.loads(response_text)
+            response_data = json.loads(response_line)
             
             if "error" in response_data:
                 error_msg = response_data["error"].get("message", "Unknown error")
@@ -429,6 +427,7 @@ class MCPService:
             "data": data,
             "timestamp": time.time()
         })
+        self._operation_started_ns[operation_id] = time.perf_counter_ns()
         
         return operation_id
     
@@ -440,6 +439,9 @@ class MCPService:
                 operation["status"] = "completed"
                 operation["result"] = result_data
                 operation["completed_at"] = time.time()
+                started_ns = self._operation_started_ns.pop(operation_id, None)
+                if started_ns is not None:
+                    operation["duration_ms"] = (time.perf_counter_ns() - started_ns) / 1e6
                 break
     
     def _hash_result(self, result: Any) -> str:
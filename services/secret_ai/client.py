@@ -9,6 +9,9 @@ from openai import OpenAI, AsyncOpenAI
 
 logger = logging.getLogger(__name__)
 
+# Tuple-format role names that differ from their OpenAI equivalents
+OPENAI_ROLES = {"human": "user"}
+
 
 class SecretAIService:
     """
@@ -168,15 +171,18 @@ class SecretAIService:
         if not self.async_client:
             raise RuntimeError("Secret AI async client not initialized")
 
+        # Resolve the model once rather than for every chunk
+        model = self.get_current_model()
+
         try:
             # Convert tuple format to OpenAI dict format
             openai_messages = self._convert_messages(messages)
 
-            logger.debug(f"Starting streaming invocation with model: {self.get_current_model()}")
+            logger.debug(f"Starting streaming invocation with model: {model}")
 
             # Use async OpenAI client with streaming
             stream = await self.async_client.chat.completions.create(
-                model=self.get_current_model(),
+                model=model,
                 messages=openai_messages,
                 stream=True
             )
@@ -197,7 +203,7 @@ class SecretAIService:
                                 "data": content,
                                 "metadata": {}
                             },
-                            "model": self.get_current_model()
+                            "model": model
                         }
 
             logger.debug(f"Streaming complete. Total chunks received: {chunk_count}")
@@ -210,7 +216,7 @@ class SecretAIService:
                     "data": "",
                     "metadata": {"completed": True}
                 },
-                "model": self.get_current_model()
+                "model": model
             }
 
         except Exception as e:
@@ -223,7 +229,7 @@ class SecretAIService:
                     "metadata": {"error": True}
                 },
                 "error": str(e),
-                "model": self.get_current_model()
+                "model": model
             }
 
     def _convert_messages(self, messages: List[Tuple[str, str]]) -> List[Dict[str, str]]:
@@ -236,23 +242,10 @@ class SecretAIService:
         Returns:
             List of dicts in OpenAI format [{"role": "user", "content": "..."}]
         """
-        openai_messages = []
-        for role, content in messages:
-            # Map role names to OpenAI format
-            openai_role = role
-            if role == "human":
-                openai_role = "user"
-            elif role == "system":
-                openai_role = "system"
-            elif role == "assistant":
-                openai_role = "assistant"
-
-            openai_messages.append({
-                "role": openai_role,
-                "content": content
-            })
-
-        return openai_messages
+        return [
+            {"role": OPENAI_ROLES.get(role, role), "content": content}
+            for role, content in messages
+        ]
 
     def format_messages(self, system_prompt: str, user_message: str) -> List[Tuple[str, str]]:
         """
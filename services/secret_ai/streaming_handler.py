@@ -2,11 +2,12 @@
 Custom Streaming Handler for SecretGPT Web Responses
 Adapts the existing SecretStreamingHandler to work with web responses instead of console output
 """
-import json
 import logging
 from typing import AsyncGenerator, Dict, Any
 from langchain.callbacks.base import BaseCallbackHandler
 
+from utils.serialization import json_dumps
+
 logger = logging.getLogger(__name__)
 
 
@@ -279,7 +280,7 @@ class StreamingChunkFormatter:
         if chunk.get("content_type"):
             event_data["content_type"] = chunk["content_type"]
         
-        return f"data: {json.dumps(event_data)}\n\n"
+        return f"data: {json_dumps(event_data)}\n\n"
     
     @staticmethod
     def to_json(chunk: Dict[str, Any]) -> Dict[str, Any]:
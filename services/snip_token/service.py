@@ -2,11 +2,9 @@
 SNIP Token Service Implementation
 Handles SNIP-20 and SNIP-721 token queries with viewing key management
 """
-import asyncio
 import logging
-import json
 from typing import Dict, Any, Optional, List
-from datetime import datetime, timedelta
+from datetime import datetime
 
 # Import secret.py SDK v1.8.2
 from secret_sdk.client.lcd.lcdclient import AsyncLCDClient
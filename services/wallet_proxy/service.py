@@ -3,9 +3,7 @@ Wallet Proxy Service for SecretGPTee VM2 Communication
 Handles secure wallet operations and blockchain transactions
 """
 import logging
-import asyncio
 import aiohttp
-import json
 from typing import Dict, Any, Optional, List
 from dataclasses import dataclass
 from datetime import datetime
@@ -0,0 +1,82 @@
+"""
+Tests for HubRouter.route_message response memoization
+"""
+import asyncio
+
+import pytest
+
+from hub.core import router as router_module
+from hub.core.router import HubRouter
+
+DETERMINISTIC = {"temperature": 0.0}
+
+
+@pytest.fixture
+def hub(monkeypatch):
+    """Router whose inner routing returns canned responses and counts calls"""
+    monkeypatch.setattr(router_module, "RESPONSE_CACHE_MIN_LATENCY", 0.0)
+    calls = []
+    responses = {}
+
+    async def fake_route_message(self, interface, message, options=None):
+        calls.append(message)
+        return dict(responses.get(message, {"success": True, "content": "answer"}))
+
+    monkeypatch.setattr(HubRouter, "_route_message", fake_route_message)
+    router = HubRouter()
+    return router, calls, responses
+
+
+def _route_twice(router, message, options):
+    async def run():
+        await router.route_message("web_ui", message, options)
+        return await router.route_message("web_ui", message, options)
+    return asyncio.run(run())
+
+
+@pytest.mark.parametrize("options", [
+    None,
+    {"temperature": 0.7},
+    {"temperature": 0.0, "wallet_connected": True},
+    {"temperature": 0.0, "system_prompt": "Wallet connected: secret1" + "a" * 38},
+    {"temperature": 0.0, "system_prompt": "Today is 2026-10-16."},
+    {"temperature": 0.0, "system_prompt": "The time is 14:05."},
+    {"temperature": 0.0, "viewing_keys": {"sscrt": "key"}},
+])
+def test_cache_key_skips_uncacheable_options(options):
+    assert HubRouter()._response_cache_key("web_ui", "hello", options) is None
+
+
+@pytest.mark.parametrize("message", ["/mcp status", "mcp test", "  /MCP tools  "])
+def test_cache_key_skips_debug_commands(message):
+    assert HubRouter()._response_cache_key("web_ui", message, DETERMINISTIC) is None
+
+
+def test_cache_key_distinguishes_interface_message_and_options():
+    router = HubRouter()
+    key = router._response_cache_key("web_ui", "hello", DETERMINISTIC)
+    assert key is not None
+    assert key == router._response_cache_key("web_ui", "hello", dict(DETERMINISTIC))
+    assert key != router._response_cache_key("telegram_bot", "hello", DETERMINISTIC)
+    assert key != router._response_cache_key("web_ui", "hello!", DETERMINISTIC)
+    assert key != router._response_cache_key("web_ui", "hello", {"temperature": 0.1})
+
+
+def test_llm_answer_is_cached(hub):
+    router, calls, _ = hub
+    response = _route_twice(router, "explain privacy", DETERMINISTIC)
+    assert response["content"] == "answer"
+    assert calls == ["explain privacy"]
+
+
+@pytest.mark.parametrize("response", [
+    {"success": True, "content": "block 1", "source": "mcp_layer", "tools_used": ["secret_query_block"]},
+    {"success": True, "content": "enhanced", "tools_used": ["secret_network_status"], "tool_results": []},
+    {"success": True, "content": "fallback", "tool_results": []},
+    {"success": False, "error": "boom"},
+])
+def test_live_or_failed_responses_are_not_cached(hub, response):
+    router, calls, responses = hub
+    responses["latest block"] = response
+    _route_twice(router, "latest block", DETERMINISTIC)
+    assert calls == ["latest block", "latest block"]
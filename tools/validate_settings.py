@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Static check for config/settings.py
+Run by pre-commit so the Settings definition is validated once at commit time
+instead of on every process start
+"""
+import ast
+import sys
+from pathlib import Path
+
+SETTINGS_FILE = Path(__file__).parent.parent / "config" / "settings.py"
+
+# Fields that may legitimately be declared without a default
+REQUIRED_FIELDS = set()
+
+
+def _settings_fields(tree: ast.Module) -> dict:
+    """Collect Settings fields mapped to whether they declare a default"""
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef) and node.name == "Settings":
+            return {
+                stmt.target.id: stmt.value is not None
+                for stmt in node.body
+                if isinstance(stmt, ast.AnnAssign) and isinstance(stmt.target, ast.Name)
+            }
+    return {}
+
+
+def _loaded_fields(tree: ast.Module) -> set:
+    """Collect the keyword arguments passed to cls(...) inside Settings.from_env()"""
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef) and node.name == "Settings":
+            for method in node.body:
+                if isinstance(method, ast.FunctionDef) and method.name == "from_env":
+                    for call in ast.walk(method):
+                        if (isinstance(call, ast.Call) and isinstance(call.func, ast.Name)
+                                and call.func.id == "cls"):
+                            return {kw.arg for kw in call.keywords if kw.arg}
+    return set()
+
+
+def validate(path: Path = SETTINGS_FILE) -> list:
+    """
+    Validate the Settings definition
+
+    Returns:
+        List of error messages (empty if valid)
+    """
+    tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+    fields = _settings_fields(tree)
+    if not fields:
+        return [f"{path}: no Settings class with fields found"]
+
+    errors = []
+    for name, has_default in fields.items():
+        if not has_default and name not in REQUIRED_FIELDS:
+            errors.append(f"{path}: Settings.{name} has no default and is not marked required")
+
+    loaded = _loaded_fields(tree)
+    for name in sorted(set(fields) - loaded):
+        errors.append(f"{path}: Settings.{name} is never read from the environment in Settings.from_env()")
+    for name in sorted(loaded - set(fields)):
+        errors.append(f"{path}: Settings.from_env() sets unknown field {name}")
+
+    return errors
+
+
+def main() -> int:
+    """Run the check and report errors"""
+    errors = validate()
+    for error in errors:
+        print(error, file=sys.stderr)
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,14 @@
+"""
+JSON serialization shared by the streaming (SSE) code paths
+"""
+import json
+from typing import Any
+
+try:
+    import orjson
+
+    def json_dumps(obj: Any) -> str:
+        """Serialize to a JSON string with orjson (per streamed chunk hot path)"""
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    json_dumps = json.dumps